@@ -0,0 +1,82 @@
+"""
+Serialization of page tool results for the LLM.
+JSON repeats every key for every element; the compact format prints each list
+as a header row plus one delimited line per element, with rounded integer
+positions and empty fields omitted.
+"""
+
+import json
+from typing import Any, Dict, List
+
+from config import config, ObservationFormat
+
+DELIMITER = '|'
+
+# Scalars longer than this (or multi-line) are printed as their own block
+_INLINE_SCALAR_LIMIT = 120
+
+
+def _format_value(value: Any) -> str:
+    """Render one field: rounded numbers, "x,y" positions, single-line text"""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float):
+        return str(round(value))
+    if isinstance(value, (list, tuple)) and all(isinstance(v, (int, float)) for v in value):
+        return ','.join(str(round(v)) for v in value)
+    text = ' '.join(str(value).split())
+    return text.replace(DELIMITER, '/')
+
+
+def _format_table(name: str, rows: List[Dict[str, Any]]) -> List[str]:
+    """Header row with the columns used by at least one row, then one line per row"""
+    columns: List[str] = []
+    for row in rows:
+        for key, value in row.items():
+            if key not in columns and _format_value(value) != '':
+                columns.append(key)
+
+    lines = [f"{name}[{len(rows)}]: {DELIMITER.join(columns)}"]
+    for row in rows:
+        cells = [_format_value(row.get(column)) for column in columns]
+        while cells and cells[-1] == '':
+            cells.pop()
+        lines.append(DELIMITER.join(cells))
+    return lines
+
+
+def to_compact(data: Dict[str, Any]) -> str:
+    """Serialize tool result dict into compact header/rows text
+
+    Args:
+        data: model_dump() of a page item
+
+    Returns:
+        Short scalars on the first line as key=value, then a table per list
+        field, then long text fields as separate blocks
+    """
+    header = []
+    tables = []
+    blocks = []
+
+    for key, value in data.items():
+        if isinstance(value, list) and value and all(isinstance(row, dict) for row in value):
+            tables.extend(_format_table(key, value))
+        elif isinstance(value, list):
+            if value:
+                header.append(f"{key}={_format_value(value)}")
+        elif isinstance(value, str) and ('\n' in value or len(value) > _INLINE_SCALAR_LIMIT):
+            blocks.append(f"{key}:\n{value}")
+        elif _format_value(value) != '':
+            header.append(f"{key}={_format_value(value)}")
+
+    return '\n'.join([f" {DELIMITER} ".join(header)] + tables + blocks)
+
+
+def format_observation(tool_name: str, data: Dict[str, Any]) -> str:
+    """Serialize page tool result in the format configured for the tool"""
+    if config.observation_formats.get(tool_name, ObservationFormat.JSON) == ObservationFormat.COMPACT:
+        return to_compact(data)
+    return json.dumps(data, ensure_ascii=False)
@@ -57,6 +57,13 @@ class GetPageLinksInput(BaseModel):
     pass
 
 
+class SearchPageInput(BaseModel):
+    """Input schema for search_page tool."""
+    query: str = Field(
+        description="Words to find on the current page (e.g., 'delivery price', 'войти'). Matches text, buttons, inputs and links."
+    )
+
+
 class GoBackInput(BaseModel):
     """Input schema for go_back tool - no parameters needed."""
     pass
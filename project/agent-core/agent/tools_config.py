@@ -2,6 +2,7 @@ from typing import List, TYPE_CHECKING
 from langchain_core.tools import StructuredTool
 from playwright.async_api import Page
 
+from config import config
 from tools.click_button import click_button
 from tools.type_text import type_text, fill_input
 from tools.press_key import press_key
@@ -9,6 +10,7 @@ from tools.wait import wait
 from tools.get_page_text_next_item import get_page_text_next_item
 from tools.get_page_buttons_next_item import get_page_buttons_next_item
 from tools.get_page_links_next_item import get_page_links_next_item
+from tools.search_page import search_page
 from .tool_schemas import (
     NavigateInput,
     ClickButtonInput,
@@ -19,9 +21,11 @@ from .tool_schemas import (
     GetPageTextInput,
     GetPageButtonsInput,
     GetPageLinksInput,
+    SearchPageInput,
     GoBackInput
 )
 from .debug_tools import collect_tool_result
+from .observation_format import format_observation
 
 if TYPE_CHECKING:
     from parser.browser_manager import BrowserManager
@@ -45,18 +49,22 @@ def create_agent_tools(page: Page, browser_manager: "BrowserManager") -> List[St
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
-        await browser_manager.navigate(url)
-        return f"Successfully navigated to: {url}"
+        waited = await browser_manager.navigate(url)
+        return f"Successfully navigated to: {url}, page ready after {waited} ms"
     
     @collect_tool_result("click_button")
     async def _click(button_id: int) -> str:
         result = await click_button(browser_manager, button_id)
+        # Restart pagination after clicking; changed DOM regions are re-parsed on next request
+        browser_manager.reset_text_items()
+        browser_manager.reset_buttons_items()
+        browser_manager.reset_links_items()
         return f"{result['message']}"
     
     @collect_tool_result("type_text")
     async def _type(input_id: int, text: str) -> str:
         result = await type_text(browser_manager, input_id, text)
-        # Reset page cache after typing (DOM may have changed)
+        # Restart pagination after typing; changed DOM regions are re-parsed on next request
         browser_manager.reset_text_items()
         browser_manager.reset_buttons_items()
         browser_manager.reset_links_items()
@@ -65,7 +73,7 @@ def create_agent_tools(page: Page, browser_manager: "BrowserManager") -> List[St
     @collect_tool_result("fill_input")
     async def _fill(input_id: int, text: str) -> str:
         result = await fill_input(browser_manager, input_id, text)
-        # Reset page cache after filling (DOM may have changed)
+        # Restart pagination after filling; changed DOM regions are re-parsed on next request
         browser_manager.reset_text_items()
         browser_manager.reset_buttons_items()
         browser_manager.reset_links_items()
@@ -74,7 +82,7 @@ def create_agent_tools(page: Page, browser_manager: "BrowserManager") -> List[St
     @collect_tool_result("press_key")
     async def _press_key(key: str) -> str:
         result = await press_key(browser_manager, key)
-        # Reset page cache after key press (DOM may have changed)
+        # Restart pagination after key press; changed DOM regions are re-parsed on next request
         browser_manager.reset_text_items()
         browser_manager.reset_buttons_items()
         browser_manager.reset_links_items()
@@ -82,36 +90,40 @@ def create_agent_tools(page: Page, browser_manager: "BrowserManager") -> List[St
     
     @collect_tool_result("get_page_text_next_item")
     async def _get_page_text_next() -> str:
-        import json
         result = await get_page_text_next_item(browser_manager)
         if result['success']:
-            return json.dumps(result['text_item'], ensure_ascii=False)
+            return format_observation("get_page_text_next_item", result['text_item'])
         return result['message']
     
     @collect_tool_result("get_page_buttons_next_item")
     async def _get_page_buttons_next() -> str:
-        import json
         result = await get_page_buttons_next_item(browser_manager)
         if result['success']:
-            return json.dumps(result['buttons_item'], ensure_ascii=False)
+            return format_observation("get_page_buttons_next_item", result['buttons_item'])
         return result['message']
     
     @collect_tool_result("get_page_links_next_item")
     async def _get_page_links_next() -> str:
-        import json
         result = await get_page_links_next_item(browser_manager)
         if result['success']:
-            return json.dumps(result['links_item'], ensure_ascii=False)
+            return format_observation("get_page_links_next_item", result['links_item'])
+        return result['message']
+    
+    @collect_tool_result("search_page")
+    async def _search_page(query: str) -> str:
+        result = await search_page(browser_manager, query)
+        if result['success']:
+            return format_observation("search_page", result['search_item'])
         return result['message']
     
     @collect_tool_result("go_back")
     async def _go_back() -> str:
-        await browser_manager.go_back()
-        return "Successfully navigated back"
+        waited = await browser_manager.go_back()
+        return f"Successfully navigated back, page ready after {waited} ms"
     
     @collect_tool_result("wait")
     async def _wait() -> str:
-        result = await wait()
+        result = await wait(browser_manager)
         return f"{result['message']}"
     
     tools = [
@@ -124,7 +136,7 @@ def create_agent_tools(page: Page, browser_manager: "BrowserManager") -> List[St
         StructuredTool.from_function(
             coroutine=_get_page_text_next,
             name="get_page_text_next_item",
-            description="Get next portion of page text (700 characters). Call multiple times to get all text. Returns: item_id, total_items, text_chunk.",
+            description=f"Get next portion of page text (whole paragraphs, about {config.text_chunk_tokens} tokens). Call multiple times to get all text. Returns: item_id, total_items, text_chunk.",
             args_schema=GetPageTextInput
         ),
         StructuredTool.from_function(
@@ -139,6 +151,12 @@ def create_agent_tools(page: Page, browser_manager: "BrowserManager") -> List[St
             description="Get next portion of page links (20 per call). Call multiple times to get all links. Returns links (text, url). Use URL with navigate tool.",
             args_schema=GetPageLinksInput
         ),
+        StructuredTool.from_function(
+            coroutine=_search_page,
+            name="search_page",
+            description="Search the current page for a phrase in one call. Returns the best matching text chunks (text, item_id) and elements: buttons/inputs with IDs for click_button, fill_input, type_text and links with URLs for navigate.",
+            args_schema=SearchPageInput
+        ),
         StructuredTool.from_function(
             coroutine=_click,
             name="click_button",
@@ -0,0 +1,4 @@
+"""
+Benchmarks for Chrome Agent performance-sensitive paths.
+Run from project root, e.g.: python -m benchmarks.bench_parser_backends
+"""
@@ -0,0 +1,56 @@
+"""
+Measures browser startup time per launch profile and headless mode.
+Each run launches Chromium the way BrowserManager does, opens a context and a
+page, loads a blank page and closes everything.
+
+Usage:
+    python -m benchmarks.bench_browser_startup [--repeat 5] [--headful]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from config import LaunchProfile
+from parser.browser_manager import launch_browser
+
+
+async def measure(headless: bool, profile: LaunchProfile, repeat: int) -> List[float]:
+    """Launch-to-first-page durations in milliseconds"""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        stealth_context, browser = await launch_browser(headless=headless, profile=profile)
+        context = await browser.new_context()
+        page = await context.new_page()
+        await page.goto('about:blank')
+        durations.append((time.perf_counter() - started) * 1000)
+
+        await browser.close()
+        await stealth_context.__aexit__(None, None, None)
+    return durations
+
+
+async def main(repeat: int, headful: bool) -> None:
+    modes = [True, False] if headful else [True]
+
+    print(f"{'headless':>8} | {'profile':>8} | {'median ms':>10} | {'min ms':>10}")
+    print("-" * 46)
+
+    for headless in modes:
+        for profile in LaunchProfile:
+            durations = await measure(headless, profile, repeat)
+            print(
+                f"{str(headless):>8} | {profile.value:>8} | "
+                f"{statistics.median(durations):>10.1f} | {min(durations):>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Benchmark browser startup")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--headful", action="store_true", help="Also measure with a visible window (needs a display)")
+    args = arg_parser.parse_args()
+    asyncio.run(main(args.repeat, args.headful))
@@ -0,0 +1,70 @@
+"""
+Measures token savings of the compact observation format on recorded pages.
+
+Recordings are debug files written by DebugCollector (last-task-info.json with
+save_debug_info enabled and ObservationFormat.JSON for the page tools): every
+page tool result stored there is re-serialized as JSON and as compact text and
+both are counted with the text chunker's token estimator.
+
+Usage:
+    python -m benchmarks.bench_observation_format last-task-info.json [more.json ...]
+"""
+
+import argparse
+import json
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Tuple
+
+from agent.observation_format import to_compact
+from parser.text_chunker import estimate_tokens
+
+
+PAGE_TOOLS = (
+    "get_page_text_next_item",
+    "get_page_buttons_next_item",
+    "get_page_links_next_item",
+    "search_page",
+)
+
+
+def recorded_items(paths: List[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (tool name, item dict) for page tool results in debug recordings"""
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            recording = json.load(f)
+        for event in recording.get('events', []):
+            if event.get('type') != 'tool_result' or event.get('tool_name') not in PAGE_TOOLS:
+                continue
+            try:
+                item = json.loads(event.get('result') or '')
+            except json.JSONDecodeError:
+                continue  # Completion message or already compact
+            if isinstance(item, dict):
+                yield event['tool_name'], item
+
+
+def main(paths: List[str]) -> None:
+    totals: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
+
+    for tool_name, item in recorded_items(paths):
+        counts = totals[tool_name]
+        counts[0] += 1
+        counts[1] += estimate_tokens(json.dumps(item, ensure_ascii=False))
+        counts[2] += estimate_tokens(to_compact(item))
+
+    if not totals:
+        print("No recorded page tool results found")
+        return
+
+    print(f"{'tool':>28} | {'items':>5} | {'json tok':>9} | {'compact tok':>11} | {'saved':>6}")
+    print("-" * 72)
+    for tool_name, (items, json_tokens, compact_tokens) in sorted(totals.items()):
+        saved = 1 - compact_tokens / json_tokens if json_tokens else 0.0
+        print(f"{tool_name:>28} | {items:>5} | {json_tokens:>9} | {compact_tokens:>11} | {saved:>6.1%}")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Benchmark compact observation format")
+    arg_parser.add_argument("recordings", nargs="+", help="DebugCollector JSON files")
+    args = arg_parser.parse_args()
+    main(args.recordings)
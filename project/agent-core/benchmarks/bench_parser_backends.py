@@ -0,0 +1,74 @@
+"""
+Compares PageParser backends on synthetic pages of 1k-50k DOM nodes.
+
+Usage:
+    python -m benchmarks.bench_parser_backends [--sizes 1000 5000 ...] [--repeat 3]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from playwright.async_api import async_playwright, Page
+
+from parser.page_parser import PageParser
+from parser.cdp_parser import CdpPageParser
+
+
+# One block is 10 DOM nodes: section, heading, paragraph, button, link, input and their text nodes
+BLOCK_NODES = 10
+
+BLOCK_TEMPLATE = """
+<section>
+  <h3>Item {i}</h3>
+  <p>Description of synthetic item number {i} with some filler text.</p>
+  <button>Buy {i}</button>
+  <a href="/item/{i}">Open item {i}</a>
+  <input type="text" name="qty{i}" placeholder="Quantity">
+</section>
+"""
+
+
+def build_page(node_count: int) -> str:
+    """Build synthetic HTML document with approximately node_count nodes"""
+    blocks = "".join(BLOCK_TEMPLATE.format(i=i) for i in range(node_count // BLOCK_NODES))
+    return f"<html><head><title>Synthetic {node_count}</title></head><body>{blocks}</body></html>"
+
+
+async def measure(page: Page, parser_class, repeat: int) -> List[float]:
+    """Run full page parse `repeat` times and return durations in milliseconds"""
+    durations = []
+    for version in range(repeat):
+        parser = parser_class(page)
+        started = time.perf_counter()
+        await parser.parse_snapshot(version)
+        durations.append((time.perf_counter() - started) * 1000)
+        await parser.release_handles()
+    return durations
+
+
+async def main(sizes: List[int], repeat: int) -> None:
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        page = await browser.new_page(viewport={'width': 800, 'height': 800})
+
+        print(f"{'nodes':>8} | {'backend':>8} | {'median ms':>10} | {'min ms':>10}")
+        print("-" * 46)
+
+        for size in sizes:
+            await page.set_content(build_page(size))
+            for name, parser_class in (("locator", PageParser), ("cdp", CdpPageParser)):
+                durations = await measure(page, parser_class, repeat)
+                print(f"{size:>8} | {name:>8} | {statistics.median(durations):>10.1f} | {min(durations):>10.1f}")
+
+        await browser.close()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Benchmark PageParser backends")
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000, 50000])
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeat))
@@ -0,0 +1,84 @@
+"""
+Compares patching a page snapshot after a small DOM change with a full re-parse.
+Each round parses the page and applies one local change: a button is
+relabelled and a banner is inserted into the first section, which shifts every
+element below it. patch_snapshot is timed; then the same change is applied
+again and a full parse_snapshot is timed for comparison.
+
+Usage:
+    python -m benchmarks.bench_snapshot_patch [--sizes 1000 5000 ...] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Tuple
+
+from playwright.async_api import async_playwright, Page
+
+from parser.page_parser import PageParser
+from parser.scripts import INSTALL_RUNTIME_SCRIPT
+from .bench_parser_backends import build_page
+
+# Local change of the kind patching is for: one subtree relabelled, one banner inserted
+MUTATION_SCRIPT = """
+(round) => {
+    const buttons = document.querySelectorAll('button');
+    buttons[Math.floor(buttons.length / 2)].textContent = 'Changed ' + round;
+    const banner = document.createElement('div');
+    banner.textContent = 'Banner ' + round;
+    document.querySelector('section').prepend(banner);  // Not body: a dirty body forces a full parse
+}
+"""
+
+
+async def measure(page: Page, repeat: int) -> Tuple[List[float], List[float]]:
+    """Patch and full-parse durations in milliseconds"""
+    patch_durations = []
+    parse_durations = []
+    for round_number in range(repeat):
+        parser = PageParser(page)
+        snapshot = await parser.parse_snapshot(0)
+        await page.evaluate(MUTATION_SCRIPT, round_number)
+
+        started = time.perf_counter()
+        patched = await parser.patch_snapshot(snapshot, 1)
+        patch_durations.append((time.perf_counter() - started) * 1000)
+        if patched is None:
+            raise RuntimeError("Change was too broad to patch; benchmark is not measuring patching")
+
+        await page.evaluate(MUTATION_SCRIPT, round_number)
+        started = time.perf_counter()
+        await parser.parse_snapshot(2)
+        parse_durations.append((time.perf_counter() - started) * 1000)
+        await parser.release_handles()
+    return patch_durations, parse_durations
+
+
+async def main(sizes: List[int], repeat: int) -> None:
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        context = await browser.new_context(viewport={'width': 800, 'height': 800})
+        await context.add_init_script(script=INSTALL_RUNTIME_SCRIPT)
+        page = await context.new_page()
+
+        print(f"{'nodes':>8} | {'patch ms':>10} | {'full ms':>10} | {'speedup':>8}")
+        print("-" * 46)
+
+        for size in sizes:
+            await page.set_content(build_page(size))
+            patch_durations, parse_durations = await measure(page, repeat)
+            patch_ms = statistics.median(patch_durations)
+            parse_ms = statistics.median(parse_durations)
+            print(f"{size:>8} | {patch_ms:>10.1f} | {parse_ms:>10.1f} | {parse_ms / patch_ms:>7.1f}x")
+
+        await browser.close()
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Benchmark snapshot patching against full parse")
+    arg_parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000, 50000])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeat))
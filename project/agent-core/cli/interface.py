@@ -31,6 +31,8 @@ class CLIInterface:
         print("  /exit     - Выход из программы")
         print("  /new      - Начать новую сессию")
         print("  /history  - Показать историю текущей сессии")
+        print("  /stats    - Показать статистику браузера")
+        print("  /block    - Блокировка изображений, шрифтов, медиа и трекеров: /block on|off")
         print("\nПросто напишите задачу для агента, чтобы начать работу.")
         print("="*60 + "\n")
     
@@ -121,6 +123,35 @@ class CLIInterface:
         elif command == "/history":
             self.show_history()
         
+        elif command == "/stats":
+            stats = browser_manager.get_handle_stats()
+            print(
+                f"\nHandles: активных {stats['live']}, "
+                f"создано {stats['created']}, освобождено {stats['released']}; "
+                f"CDP-сессий страницы активных {stats['session_live']}"
+            )
+            if browser_manager.startup_time_ms is not None:
+                print(f"Запуск браузера: {browser_manager.startup_time_ms:.0f} мс")
+            blocking = browser_manager.get_blocking_stats()
+            if blocking['enabled']:
+                last, total = blocking['last_navigation'], blocking['total']
+                print(
+                    f"Заблокировано запросов: последняя навигация {last.count} "
+                    f"(сэкономлено по оценке ~{last.estimated_bytes // 1024} КБ), всего {total.count} "
+                    f"(по оценке ~{total.estimated_bytes // 1024} КБ)"
+                )
+            print()
+        
+        elif command == "/block" or command.startswith("/block "):
+            argument = command[len("/block"):].strip().lower()
+            if argument in ("on", "off"):
+                await browser_manager.set_request_blocking(argument == "on")
+            enabled = browser_manager.get_blocking_stats()['enabled']
+            print(f"\nБлокировка изображений, шрифтов, медиа и трекеров {'включена' if enabled else 'выключена'}")
+            if argument not in ("on", "off"):
+                print("Использование: /block on|off")
+            print()
+        
         else:
             print(f"\n⚠ Неизвестная команда: {command}\n")
     
@@ -5,7 +5,7 @@ All environment variables and application settings are managed here.
 
 import os
 from enum import Enum
-from typing import Optional
+from typing import Callable, Dict, List, Optional
 from dotenv import load_dotenv
 
 
@@ -15,6 +15,48 @@ class AppMode(Enum):
     PRODUCTION = "PRODUCTION"
 
 
+class LaunchProfile(Enum):
+    """Chromium command-line profile used by BrowserManager"""
+    DEFAULT = "default"  # Playwright defaults
+    FAST = "fast"        # Adds --disable-gpu in headless mode; for servers without a GPU
+
+
+class ProfileMode(Enum):
+    """Browser state kept between runs"""
+    EPHEMERAL = "ephemeral"          # Fresh profile on every start
+    USER_DATA_DIR = "user_data_dir"  # Persistent Chromium profile: cookies, storage and HTTP cache
+    STORAGE_STATE = "storage_state"  # Cookies and local storage saved to JSON on stop, restored on start
+
+
+class ParserBackend(Enum):
+    """Engine used by the page parser to read the DOM"""
+    LOCATOR = "locator"  # In-page scripts via page.evaluate
+    CDP = "cdp"          # Chrome DevTools Protocol DOMSnapshot
+
+
+class InteractiveSource(Enum):
+    """Source of buttons and input fields for get_page_buttons_next_item"""
+    SELECTORS = "selectors"          # Hard-coded CSS selector lists
+    ACCESSIBILITY = "accessibility"  # Chromium accessibility tree roles
+
+
+class TextMode(Enum):
+    """Order of page text served by get_page_text_next_item"""
+    FULL = "full"                  # body.innerText in page order
+    MAIN_CONTENT = "main_content"  # Detected main content first, navigation and other boilerplate last
+
+
+class ObservationFormat(Enum):
+    """Serialization of page tool results sent to the LLM"""
+    JSON = "json"        # json.dumps of the item
+    COMPACT = "compact"  # Header row plus one delimited line per element
+
+
+def is_valid_profile_name(name: str) -> bool:
+    """Browser profile name usable as a single directory name under the profiles directory"""
+    return bool(name) and '..' not in name and not any(sep in name for sep in ('/', '\\', os.sep))
+
+
 class Config:
     """
     Central configuration class for the application.
@@ -33,12 +75,84 @@ class Config:
         self.browser_viewport_width: int = 800
         self.browser_viewport_height: int = 800
         self.browser_timeout: int = 30000 
+        self.browser_headless: bool = os.getenv("BROWSER_HEADLESS", "false").lower() == "true"
+        self.browser_launch_profile = LaunchProfile.DEFAULT
+        
+        # Browser profile settings (state kept between runs)
+        # Invalid values fall back to EPHEMERAL here and are reported by validate()
+        self._browser_profile_mode_env: str = os.getenv("BROWSER_PROFILE_MODE", "ephemeral").strip().lower()
+        self.browser_profile_mode = next(
+            (mode for mode in ProfileMode if mode.value == self._browser_profile_mode_env),
+            ProfileMode.EPHEMERAL
+        )
+        self.browser_profile_name: str = os.getenv("BROWSER_PROFILE", "default")
+        self.browser_profiles_dir: str = "browser_profiles"
+        self.browser_profile_max_size_mb: int = 500  # Caches are dropped first, then the whole profile
+        self.browser_profile_max_age_days: int = 30  # Profiles unused this long are deleted on start
+        
+        # Network request blocking settings (resources that do not change page text and elements).
+        # Blocking goes through DevTools Fetch interception, not Playwright routing: routing disables
+        # the HTTP cache and would undo the warm cache of ProfileMode.USER_DATA_DIR.
+        # Cross-origin iframes running in their own process are not filtered.
+        # Off by default: the visible browser shows pages as usual. Turn on with BLOCK_REQUESTS=true
+        # or per session with the /block command (BrowserManager.set_request_blocking)
+        self.block_requests: bool = os.getenv("BLOCK_REQUESTS", "false").lower() == "true"
+        self.blocked_resource_types: List[str] = ['image', 'media', 'font']
+        self.blocked_domains: List[str] = [
+            'google-analytics.com',
+            'googletagmanager.com',
+            'doubleclick.net',
+            'googlesyndication.com',
+            'facebook.net',
+            'mc.yandex.ru',
+            'hotjar.com',
+            'segment.io',
+            'mixpanel.com',
+            'criteo.com'
+        ]
+        self.allowed_domains: List[str] = []  # Never blocked, overrides both lists above
+        
+        # Browser pool settings (concurrent agent sessions on one browser process)
+        self.pool_max_contexts: int = 20  # Open session contexts; least recently used idle ones are recycled
+        self.pool_context_memory_cap_mb: int = 512  # Context is recycled on release when its JS heap exceeds this
         
         # Page parsing settings
+        self.parser_backend = ParserBackend.LOCATOR
+        self.interactive_source = InteractiveSource.SELECTORS
+        self.patch_max_dirty_roots: int = 50  # Changed subtrees above this trigger full re-parse
+        self.parse_concurrency: int = 4  # Extractions run concurrently over the Playwright connection
         self.parse_item_size: int = 1000  # Height in pixels for buttons/inputs sections
-        self.text_chunk_size: int = 700   # Characters per text chunk
+        self.text_chunk_tokens: int = 400  # Estimated LLM tokens per text chunk
+        # Token counter for text chunks, e.g. lambda text: len(encoding.encode(text)) with the
+        # model's tokenizer; None uses the character-based estimate of parser.text_chunker
+        self.text_token_counter: Optional[Callable[[str], int]] = None
+        self.text_mode = TextMode.FULL
         self.links_chunk_size: int = 20   # Links per chunk
-        self.wait_delay: int = 5000  # Wait delay in milliseconds (5 seconds)
+        self.search_top_k: int = 5  # Results returned by search_page
+        self.collapse_boilerplate: bool = True  # Collapse text and links repeated across pages of a domain
+        self.boilerplate_max_fingerprints: int = 5000  # Remembered text lines and links per domain
+        self.boilerplate_min_collapsed_chars: int = 60  # Shorter repeated runs are cheaper than the marker
+        self.scroll_streaming: bool = False  # Scroll for lazily loaded content after the last buttons/links item
+        self.scroll_max_steps: int = 10  # Viewport scrolls per document
+        self.scroll_max_new_elements: int = 500  # New buttons, inputs and links per document before scrolling stops
+        self.scroll_wait_timeout: int = 600  # Milliseconds to wait for added elements after a scroll; none = stop scrolling
+        self.scroll_quiet_time: int = 300  # Milliseconds without DOM changes before growth is read
+        self.wait_delay: int = 5000  # Upper bound of the wait tool in milliseconds (5 seconds)
+        self.wait_min_delay: int = 2000  # The wait tool always lets this much time pass (interstitials, countdowns)
+        
+        # Page readiness settings (replace fixed networkidle waits after navigation and actions)
+        self.readiness_quiet_ms: int = 500  # DOM and document/XHR/fetch requests quiet this long = page ready
+        self.readiness_long_request_ms: int = 3000  # Requests open longer (long-polling, streams) are not waited for
+        self.readiness_navigation_timeout: int = 10000  # Upper bound after navigate/back/forward
+        self.readiness_action_timeout: int = 3000  # Upper bound after click, typing and key presses
+        
+        # Result format per page information tool (COMPACT: tabular text, see benchmarks/bench_observation_format.py)
+        self.observation_formats: Dict[str, ObservationFormat] = {
+            "get_page_text_next_item": ObservationFormat.JSON,
+            "get_page_buttons_next_item": ObservationFormat.JSON,
+            "get_page_links_next_item": ObservationFormat.JSON,
+            "search_page": ObservationFormat.JSON,
+        }
         
         self.agent_model: str = "openai/gpt-oss-120b"  # Production model with tool calling
         self.agent_temperature: float = 0.7
@@ -55,6 +169,16 @@ class Config:
                 "GROQ_API_KEY not found in environment variables. "
                 "Please create .env file and add: GROQ_API_KEY=your_key_here"
             )
+        if self._browser_profile_mode_env not in {mode.value for mode in ProfileMode}:
+            raise ValueError(
+                f"Invalid BROWSER_PROFILE_MODE '{self._browser_profile_mode_env}'. "
+                f"Use one of: {', '.join(mode.value for mode in ProfileMode)}"
+            )
+        if not is_valid_profile_name(self.browser_profile_name):
+            raise ValueError(
+                f"Invalid BROWSER_PROFILE '{self.browser_profile_name}'. "
+                "Use a plain name without path separators or '..'"
+            )
     
     def is_debug(self) -> bool:
         return self.mode == AppMode.DEBUG
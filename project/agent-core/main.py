@@ -32,7 +32,7 @@ async def main():
         # Start browser
         print("📱 Запуск браузера...")
         await browser_manager.start()
-        print("✓ Браузер запущен\n")
+        print(f"✓ Браузер запущен за {browser_manager.startup_time_ms:.0f} мс\n")
         
         # Create agent graph
         agent_graph = create_agent_graph(browser_manager.page, browser_manager, config.groq_api_key)
@@ -1,7 +1,7 @@
 from .button import Button, ButtonInternal
 from .link import Link
 from .input_field import Input, InputInternal
-from .page import PageTextItem, PageButtonsItem, PageLinksItem
+from .page import PageTextItem, PageButtonsItem, PageLinksItem, SearchHit, PageSearchItem
 from .session import Session
 
 __all__ = [
@@ -9,5 +9,6 @@ __all__ = [
     "Link",
     "Input", "InputInternal",
     "PageTextItem", "PageButtonsItem", "PageLinksItem",
+    "SearchHit", "PageSearchItem",
     "Session"
 ]
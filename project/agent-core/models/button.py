@@ -11,6 +11,8 @@ class ButtonInternal:
     """Internal button model with Playwright element reference.
     Stored in BrowserManager for click operations."""
     
+    __slots__ = ('id', 'element', 'text', 'position', 'parent_text')
+    
     def __init__(
         self, 
         element_id: int, 
@@ -32,6 +34,7 @@ class Button(BaseModel):
     text: str = Field(..., description="Visible text content of the button")
     position: Tuple[float, float] = Field(..., description="X, Y coordinates of the button center")
     parent_text: Optional[str] = Field(None, description="Text content of parent container(s)")
+    role: Optional[str] = Field(None, description="Accessibility role (accessibility observation mode only)")
     
     class Config:
         frozen = True
@@ -11,6 +11,8 @@ class InputInternal:
     """Internal input model with Playwright element reference.
     Stored in BrowserManager for type/fill operations."""
     
+    __slots__ = ('id', 'element', 'input_type', 'name', 'placeholder', 'position', 'parent_text')
+    
     def __init__(
         self,
         element_id: int,
@@ -34,10 +36,11 @@ class Input(BaseModel):
     """Input model for agent. Contains information for decision making."""
     id: int = Field(..., description="Unique ID to interact with this input")
     input_type: str = Field(..., description="Type of input (text, email, password, etc.)")
-    name: str = Field(..., description="Name attribute of the input")
+    name: str = Field(..., description="Name attribute of the input (accessible name in accessibility observation mode)")
     placeholder: str = Field(..., description="Placeholder text")
     position: Tuple[float, float] = Field(..., description="X, Y coordinates")
     parent_text: Optional[str] = Field(None, description="Text content of parent container(s)")
+    role: Optional[str] = Field(None, description="Accessibility role (accessibility observation mode only)")
     
     class Config:
         frozen = True
@@ -2,7 +2,7 @@
 # Each model represents a portion of page data for the agent
 # Supports pagination to avoid context overflow
 
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 from .button import Button
@@ -42,6 +42,31 @@ class PageLinksItem(BaseModel):
     url: str = Field(..., description="Current page URL")
     title: str = Field(..., description="Page title from <title> tag")
     links: List[Link] = Field(default_factory=list, description="Links in this chunk")
+    repeated_links_omitted: Optional[int] = Field(None, description="Links left out because they repeat from other pages of this site (menus, footers)")
+    
+    class Config:
+        frozen = True
+
+
+class SearchHit(BaseModel):
+    """Page search match: text chunk or page element."""
+    kind: str = Field(..., description="Match type: text, button, input or link")
+    score: float = Field(..., description="BM25 relevance score")
+    text: str = Field(..., description="Matching text chunk, element text or link text")
+    item_id: Optional[int] = Field(None, description="Text chunk ID (text matches)")
+    id: Optional[int] = Field(None, description="Element ID for click_button, fill_input, type_text (button and input matches)")
+    url: Optional[str] = Field(None, description="Link URL for navigate (link matches)")
+    
+    class Config:
+        frozen = True
+
+
+class PageSearchItem(BaseModel):
+    """Best matches of a search query over the current page."""
+    url: str = Field(..., description="Current page URL")
+    title: str = Field(..., description="Page title from <title> tag")
+    query: str = Field(..., description="Search query")
+    hits: List[SearchHit] = Field(default_factory=list, description="Matches, most relevant first")
     
     class Config:
         frozen = True
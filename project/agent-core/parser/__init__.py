@@ -1,4 +1,6 @@
 from .browser_manager import BrowserManager
+from .browser_pool import BrowserPool
 from .page_parser import PageParser
+from .page_snapshot import PageSnapshot
 
-__all__ = ["BrowserManager", "PageParser"]
+__all__ = ["BrowserManager", "BrowserPool", "PageParser", "PageSnapshot"]
@@ -0,0 +1,122 @@
+"""
+Interactive element discovery from Chromium's accessibility tree.
+Roles and accessible names come from Accessibility.getFullAXTree, geometry and
+selectors from a DOMSnapshot of the same document, so the whole page is
+observed with two CDP calls instead of one query per CSS selector.
+"""
+
+from typing import List, Optional, Set, Tuple
+
+from .dom_snapshot import DomSnapshotDocument
+from .scripts import ELEMENT_TEXT_LIMIT
+
+# Roles the agent can act on with click_button
+CLICKABLE_ROLES = {
+    'button', 'link', 'checkbox', 'radio', 'switch', 'tab',
+    'menuitem', 'menuitemcheckbox', 'menuitemradio',
+    'option', 'treeitem', 'combobox', 'listbox', 'slider'
+}
+
+# Roles the agent can act on with fill_input / type_text
+TEXT_INPUT_ROLES = {'textbox', 'searchbox', 'spinbutton'}
+
+# Role reported for elements with click handlers but no interactive role (e.g. clickable divs)
+GENERIC_CLICKABLE_ROLE = 'clickable'
+
+
+class AccessibleElement:
+    """Interactive element found in the accessibility tree"""
+
+    def __init__(
+        self,
+        node: int,
+        role: str,
+        name: str,
+        is_input: bool,
+        position: Tuple[float, float],
+        selector: str
+    ):
+        self.node = node
+        self.role = role
+        self.name = name
+        self.is_input = is_input
+        self.position = position
+        self.selector = selector
+
+
+def _ax_value(ax_node: dict, key: str) -> Optional[str]:
+    value = ax_node.get(key)
+    if not value:
+        return None
+    return value.get('value')
+
+
+def _has_ancestor_in(document: DomSnapshotDocument, node: int, nodes: Set[int]) -> bool:
+    parent = document.parent_index[node]
+    while parent >= 0:
+        if parent in nodes:
+            return True
+        parent = document.parent_index[parent]
+    return False
+
+
+def collect_accessible_elements(ax_nodes: List[dict], document: DomSnapshotDocument) -> List[AccessibleElement]:
+    """Build interactive element list from AX tree nodes and DOM snapshot, in document order
+
+    Args:
+        ax_nodes: Nodes returned by Accessibility.getFullAXTree
+        document: DOMSnapshot of the same page
+
+    Returns:
+        Visible interactive elements with role, accessible name, position and selector
+    """
+    elements: List[AccessibleElement] = []
+    covered: Set[int] = set()
+
+    for ax_node in ax_nodes:
+        if ax_node.get('ignored'):
+            continue
+        role = _ax_value(ax_node, 'role')
+        if role not in CLICKABLE_ROLES and role not in TEXT_INPUT_ROLES:
+            continue
+
+        node = document.node_by_backend_id(ax_node.get('backendDOMNodeId'))
+        if node is None or node in covered:
+            continue
+        position = document.box_center(node)
+        selector = document.css_path(node)
+        if not position or not selector:
+            continue
+
+        is_input = role in TEXT_INPUT_ROLES or (
+            role == 'combobox' and document.tag(node) in ('INPUT', 'TEXTAREA')
+        )
+        name = ' '.join((_ax_value(ax_node, 'name') or '').split())[:ELEMENT_TEXT_LIMIT]
+
+        elements.append(AccessibleElement(node, role, name, is_input, position, selector))
+        covered.add(node)
+
+    # Containers of interactive elements often carry delegated click handlers
+    ancestors: Set[int] = set()
+    for node in covered:
+        parent = document.parent_index[node]
+        while parent >= 0 and parent not in ancestors:
+            ancestors.add(parent)
+            parent = document.parent_index[parent]
+
+    for node in sorted(document.clickable):
+        if node in covered or node in ancestors or _has_ancestor_in(document, node, covered):
+            continue
+        position = document.box_center(node)
+        selector = document.css_path(node)
+        if not position or not selector:
+            continue
+        name = document.text_content(node, ELEMENT_TEXT_LIMIT)
+        if not name:
+            continue
+
+        elements.append(AccessibleElement(node, GENERIC_CLICKABLE_ROLE, name, False, position, selector))
+        covered.add(node)
+
+    elements.sort(key=lambda element: element.node)
+    return elements
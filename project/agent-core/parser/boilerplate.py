@@ -0,0 +1,129 @@
+"""
+Cross-page boilerplate detection per domain.
+Text lines and links are fingerprinted on every parsed page; on later pages of
+the same domain, runs of lines and links already seen on another page (headers,
+menus, footers) are collapsed, so multi-page tasks do not re-read them.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Set, Tuple
+from urllib.parse import urlsplit
+
+from models.link import Link
+
+# Pages remembered per fingerprint: two are enough to tell "seen elsewhere"
+_PAGES_PER_FINGERPRINT = 2
+
+
+def _page_key(url: str) -> Tuple[str, str]:
+    """(domain, page URL without fragment)"""
+    parts = urlsplit(url)
+    return parts.hostname or '', parts._replace(fragment='').geturl()
+
+
+def _normalize(text: str) -> str:
+    return ' '.join(text.lower().split())
+
+
+class DomainFingerprints:
+    """Fingerprints seen on pages of one domain, oldest evicted first"""
+
+    def __init__(self, max_fingerprints: int):
+        self.max_fingerprints = max_fingerprints
+        self._pages: "OrderedDict[int, Set[str]]" = OrderedDict()
+
+    def seen_elsewhere(self, fingerprint: int, page: str) -> bool:
+        """Whether fingerprint was recorded on a page other than `page`"""
+        pages = self._pages.get(fingerprint)
+        return bool(pages) and (len(pages) > 1 or page not in pages)
+
+    def record(self, fingerprints: Set[int], page: str) -> None:
+        """Remember fingerprints of a parsed page"""
+        for fingerprint in fingerprints:
+            pages = self._pages.get(fingerprint)
+            if pages is None:
+                self._pages[fingerprint] = {page}
+            else:
+                if len(pages) < _PAGES_PER_FINGERPRINT:
+                    pages.add(page)
+                self._pages.move_to_end(fingerprint)
+
+        while len(self._pages) > self.max_fingerprints:
+            self._pages.popitem(last=False)
+
+
+class BoilerplateRegistry:
+    """Per-domain block fingerprints kept by BrowserManager for the browser session"""
+
+    def __init__(self, max_fingerprints_per_domain: int, min_collapsed_chars: int):
+        self.max_fingerprints_per_domain = max_fingerprints_per_domain
+        self.min_collapsed_chars = min_collapsed_chars
+        self._domains: Dict[str, DomainFingerprints] = {}
+
+    def _domain(self, domain: str) -> DomainFingerprints:
+        fingerprints = self._domains.get(domain)
+        if fingerprints is None:
+            fingerprints = DomainFingerprints(self.max_fingerprints_per_domain)
+            self._domains[domain] = fingerprints
+        return fingerprints
+
+    def collapse_text(self, url: str, text: str) -> Tuple[str, List[str]]:
+        """Replace runs of lines seen on other pages of the domain with a one-line marker
+
+        Args:
+            url: Page URL
+            text: Full page text
+
+        Returns:
+            Tuple of (text with repeated runs collapsed, text of each collapsed run);
+            runs shorter than the marker are kept
+        """
+        domain, page = _page_key(url)
+        fingerprints = self._domain(domain)
+        lines = text.split('\n')
+        hashes = [hash(_normalize(line)) for line in lines]
+
+        result: List[str] = []
+        collapsed: List[str] = []
+        run: List[str] = []
+        for line, fingerprint in zip(lines, hashes):
+            if line.strip() and fingerprints.seen_elsewhere(fingerprint, page):
+                run.append(line)
+                continue
+            result.extend(self._collapse_run(run, domain, collapsed))
+            run = []
+            result.append(line)
+        result.extend(self._collapse_run(run, domain, collapsed))
+
+        fingerprints.record({fingerprint for line, fingerprint in zip(lines, hashes) if line.strip()}, page)
+        return '\n'.join(result), collapsed
+
+    def _collapse_run(self, run: List[str], domain: str, collapsed: List[str]) -> List[str]:
+        if not run:
+            return []
+        if sum(len(line) for line in run) < self.min_collapsed_chars:
+            return run
+        collapsed.append('\n'.join(run))
+        return [f"[{len(run)} lines repeated from other pages of {domain} omitted]"]
+
+    def collapse_links(self, url: str, links: List[Link]) -> Tuple[List[Link], int]:
+        """Drop links already seen on other pages of the domain
+
+        Args:
+            url: Page URL
+            links: Links of the page
+
+        Returns:
+            Tuple of (remaining links, number of links dropped)
+        """
+        domain, page = _page_key(url)
+        fingerprints = self._domain(domain)
+        hashes = [hash((link.url, _normalize(link.text))) for link in links]
+
+        kept = [
+            link for link, fingerprint in zip(links, hashes)
+            if not fingerprints.seen_elsewhere(fingerprint, page)
+        ]
+
+        fingerprints.record(set(hashes), page)
+        return kept, len(links) - len(kept)
@@ -1,118 +1,330 @@
-from typing import Optional, Dict, List, Any
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright, TimeoutError as PlaywrightTimeout
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Any, Tuple, TYPE_CHECKING
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Error as PlaywrightError
 from playwright_stealth import Stealth
 
 from loguru import logger
 
-from config import config
+from config import config, LaunchProfile, ParserBackend, ProfileMode
 from agent.debug_tools import log_error
 from exceptions.browser_closed import BrowserClosedError
 from models.button import ButtonInternal
 from models.input_field import InputInternal
-from models.page import PageTextItem, PageButtonsItem, PageLinksItem
+from models.page import PageTextItem, PageButtonsItem, PageLinksItem, PageSearchItem
+from .boilerplate import BoilerplateRegistry
+from .browser_profile import BrowserProfileStore
+from .handle_tracker import HandleTracker
+from .page_snapshot import PageSnapshot
+from .readiness import PageReadiness
+from .request_filter import RequestFilter
+from .scroll_budget import ScrollBudget
+from .scripts import CLAIM_ELEMENT_SCRIPT, INSTALL_RUNTIME_SCRIPT
+
+if TYPE_CHECKING:
+    from parser.page_parser import PageParser
+
+
+# Chromium switches of LaunchProfile.FAST on top of Playwright's defaults, which
+# already turn off extensions, background networking and throttling, component
+# updates, sync, first-run UI and /dev/shm use. Headless only: without a window
+# nothing is composited on screen, while in a visible window --disable-gpu
+# forces software compositing and slows rendering down. Measure changes here
+# with benchmarks/bench_browser_startup.py.
+FAST_HEADLESS_ARGS: List[str] = [
+    '--disable-gpu'
+]
+
+
+def _launch_args(profile: LaunchProfile, headless: bool) -> List[str]:
+    """Chromium switches of a launch profile"""
+    if profile == LaunchProfile.FAST and headless:
+        return list(FAST_HEADLESS_ARGS)
+    return []
+
+
+async def launch_browser(
+    headless: Optional[bool] = None,
+    profile: Optional[LaunchProfile] = None
+) -> Tuple[Any, Browser]:
+    """Launch Chromium through stealth-patched Playwright
+    
+    Args:
+        headless: Run without a window (config.browser_headless by default)
+        profile: Command-line profile (config.browser_launch_profile by default)
+    
+    Returns:
+        Tuple of (stealth Playwright context manager to exit on shutdown, browser)
+    """
+    if headless is None:
+        headless = config.browser_headless
+    if profile is None:
+        profile = config.browser_launch_profile
+    
+    stealth_context = Stealth().use_async(async_playwright())
+    playwright = await stealth_context.__aenter__()
+    browser = await playwright.chromium.launch(
+        headless=headless,
+        args=_launch_args(profile, headless)
+    )
+    return stealth_context, browser
+
+
+async def launch_persistent_context(user_data_dir: Path, disk_cache_size: int) -> Tuple[Any, BrowserContext]:
+    """Launch Chromium on a persistent profile directory
+    
+    Args:
+        user_data_dir: Profile directory kept between runs
+        disk_cache_size: HTTP cache limit in bytes, so the profile stays under its size cap
+    
+    Returns:
+        Tuple of (stealth Playwright context manager to exit on shutdown, context)
+    """
+    stealth_context = Stealth().use_async(async_playwright())
+    playwright = await stealth_context.__aenter__()
+    context = await playwright.chromium.launch_persistent_context(
+        str(user_data_dir),
+        headless=config.browser_headless,
+        args=_launch_args(config.browser_launch_profile, config.browser_headless) + [f'--disk-cache-size={disk_cache_size}'],
+        viewport={
+            'width': config.browser_viewport_width,
+            'height': config.browser_viewport_height
+        }
+    )
+    return stealth_context, context
 
 
 class BrowserManager:
     """Manages browser lifecycle using Playwright and page element storage"""
     
     def __init__(self):
-        self._stealth: Optional[Stealth] = None
         self._stealth_context: Optional[Any] = None
-        self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
+        self._readiness: Optional[PageReadiness] = None
         
-        # Text items state
-        self._text_items: List[PageTextItem] = []
-        self._current_text_index: int = 0
-        self._last_text_parsed_url: Optional[str] = None
+        # CDP sessions kept open while the page lives (request filter); parse-scoped
+        # resources are tracked separately in self._handles
+        self._session_handles = HandleTracker()
         
-        # Buttons items state
-        self._buttons_items: List[PageButtonsItem] = []
-        self._current_buttons_index: int = 0
-        self._last_buttons_parsed_url: Optional[str] = None
+        # Blocking of images, fonts, media and trackers; enabled per session
+        self._request_filter = RequestFilter(
+            config.blocked_resource_types,
+            config.blocked_domains,
+            config.allowed_domains,
+            self._session_handles
+        )
         
-        # Links items state
-        self._links_items: List[PageLinksItem] = []
-        self._current_links_index: int = 0
-        self._last_links_parsed_url: Optional[str] = None
+        # Profiles kept between runs; paths of the profile in use, if any
+        self._profiles = BrowserProfileStore(
+            config.browser_profiles_dir,
+            config.browser_profile_max_size_mb,
+            config.browser_profile_max_age_days
+        )
+        self._user_data_dir: Optional[Path] = None
+        self._storage_state_path: Optional[Path] = None
         
-        # Playwright element storage
-        self._buttons_internal: Dict[int, ButtonInternal] = {}
-        self._inputs_internal: Dict[int, InputInternal] = {}
+        # Milliseconds from start() until the page was ready (launch, context and page)
+        self.startup_time_ms: Optional[float] = None
         
-    async def start(self):
-        """Start browser instance with stealth mode (always visible)"""
-        self._stealth = Stealth()
-        self._stealth_context = self._stealth.use_async(async_playwright())
-        self._playwright = await self._stealth_context.__aenter__()
-        self._browser = await self._playwright.chromium.launch(
-            headless=False  # Always visible window
+        # Page snapshot shared by text, buttons and links items
+        self._snapshot: Optional[PageSnapshot] = None
+        self._snapshot_version: int = 0
+        
+        # Handles and CDP sessions created by parsers, released after every parse
+        self._handles = HandleTracker()
+        
+        # Per-domain fingerprints of text and links seen on visited pages
+        self._boilerplate = BoilerplateRegistry(
+            config.boilerplate_max_fingerprints,
+            config.boilerplate_min_collapsed_chars
         )
-        self._context = await self._browser.new_context(
+        
+        # Scroll steps and new elements spent loading lazy content of the current document
+        self._scroll_budget = ScrollBudget(config.scroll_max_steps, config.scroll_max_new_elements)
+        
+        # Pagination cursors over the current snapshot
+        self._current_text_index: int = 0
+        self._current_buttons_index: int = 0
+        self._current_links_index: int = 0
+        
+    async def start(self):
+        """Start browser instance with stealth mode, headless, launch and browser profile from config"""
+        started = time.perf_counter()
+        mode = config.browser_profile_mode
+        name = config.browser_profile_name
+        
+        if mode != ProfileMode.EPHEMERAL:
+            for action in self._profiles.cleanup(active=name):
+                if config.is_debug():
+                    logger.debug(f"Browser profile cleanup: {action}")
+        
+        if mode == ProfileMode.USER_DATA_DIR:
+            self._user_data_dir = self._profiles.user_data_dir(name)
+            self._stealth_context, context = await launch_persistent_context(
+                self._user_data_dir,
+                self._profiles.max_size // 2  # Leave room for storage, databases and code caches
+            )
+            await self._setup_context(context)
+        else:
+            self._stealth_context, self._browser = await launch_browser()
+            storage_state = self._profiles.storage_state_path(name) if mode == ProfileMode.STORAGE_STATE else None
+            await self.open_context(self._browser, storage_state)
+        
+        self.startup_time_ms = (time.perf_counter() - started) * 1000
+        
+        if config.is_debug():
+            logger.debug(
+                f"Browser started in {self.startup_time_ms:.0f} ms "
+                f"(headless={config.browser_headless}, profile={config.browser_launch_profile.value})"
+            )
+        
+    async def open_context(self, browser: Browser, storage_state: Optional[Path] = None):
+        """Open isolated context and page on a running browser
+        
+        Used directly by BrowserPool, which shares one browser process between
+        sessions; the browser stays owned by the caller.
+        
+        Args:
+            browser: Running browser
+            storage_state: Cookies and local storage file, restored if it exists
+                and saved back when the context closes
+        """
+        self._storage_state_path = storage_state
+        context = await browser.new_context(
             viewport={
                 'width': config.browser_viewport_width,
                 'height': config.browser_viewport_height
-            }
+            },
+            storage_state=str(storage_state) if storage_state and storage_state.exists() else None
         )
-        self._page = await self._context.new_page()
+        await self._setup_context(context)
+        
+    async def _setup_context(self, context: BrowserContext):
+        """Prepare context for the agent and open its page"""
+        self._context = context
+        # Install DOM-change observer into every document before page scripts run
+        await self._context.add_init_script(script=INSTALL_RUNTIME_SCRIPT)
+        # A persistent context starts with a blank page already open
+        self._page = self._context.pages[0] if self._context.pages else await self._context.new_page()
         self._page.set_default_timeout(config.browser_timeout)
+        if config.block_requests:
+            await self._request_filter.enable(self._context, self._page)
+        self._readiness = PageReadiness(self._page)
         
-    async def stop(self):
-        """Stop browser and cleanup resources"""
+    async def close_context(self):
+        """Close page and context, keeping the browser running"""
+        if self._context and self._storage_state_path:
+            try:
+                await self._context.storage_state(path=str(self._storage_state_path))
+            except (PlaywrightError, OSError) as e:
+                # Crashed page or full disk: the saved state is lost, the context must still close
+                log_error(e)
+        await self._request_filter.disable()
         if self._page:
             await self._page.close()
+            self._page = None
+            self._readiness = None
         if self._context:
             await self._context.close()
+            self._context = None
+        self.invalidate_snapshot()
+        
+    async def stop(self):
+        """Stop browser and cleanup resources"""
+        await self.close_context()
         if self._browser:
             await self._browser.close()
         if self._stealth_context:
             await self._stealth_context.__aexit__(None, None, None)
+        
+        # Chromium no longer holds the profile: trim it if this run grew it past the cap
+        if self._user_data_dir:
+            action = self._profiles.enforce_size_cap(self._user_data_dir)
+            if action and config.is_debug():
+                logger.debug(f"Browser profile {self._user_data_dir.name}: {action}")
             
-    async def navigate(self, url: str) -> None:
-        """Navigate to URL"""
+    async def navigate(self, url: str) -> int:
+        """Navigate to URL and wait until the page is ready
+        
+        Returns:
+            Milliseconds waited for readiness after DOMContentLoaded
+        """
         if not self._page:
             err = BrowserClosedError("Navigate")
             log_error(err)
             raise err
+        self._start_navigation()
         await self._page.goto(url, wait_until='domcontentloaded')
-        try:
-            await self._page.wait_for_load_state('networkidle', timeout=10000)
-        except PlaywrightTimeout:
-            if config.is_debug():
-                logger.debug(f"networkidle timeout for {url}, continuing anyway")
+        waited = await self.wait_until_ready(config.readiness_navigation_timeout)
+        
+        if self._request_filter.enabled and config.is_debug():
+            logger.debug(f"Blocked on {url}: {self._request_filter.navigation}")
         
-        # Reset all page items after navigation
-        self.reset_text_items()
-        self.reset_buttons_items()
-        self.reset_links_items()
+        # Drop page snapshot after navigation
+        self.invalidate_snapshot()
+        return waited
         
-    async def go_back(self) -> None:
-        """Navigate back in history"""
+    async def go_back(self) -> int:
+        """Navigate back in history and wait until the page is ready
+        
+        Returns:
+            Milliseconds waited for readiness
+        """
         if not self._page:
             err = BrowserClosedError("Go back")
             log_error(err)
             raise err
-        await self._page.go_back()
+        self._start_navigation()
+        await self._page.go_back(wait_until='domcontentloaded')
+        waited = await self.wait_until_ready(config.readiness_navigation_timeout)
+        
+        # Drop page snapshot after navigation
+        self.invalidate_snapshot()
+        return waited
         
-        # Reset all page items after navigation
-        self.reset_text_items()
-        self.reset_buttons_items()
-        self.reset_links_items()
+    async def go_forward(self) -> int:
+        """Navigate forward in history and wait until the page is ready
         
-    async def go_forward(self) -> None:
-        """Navigate forward in history"""
+        Returns:
+            Milliseconds waited for readiness
+        """
         if not self._page:
             err = BrowserClosedError("Go forward")
             log_error(err)
             raise err
-        await self._page.go_forward()
+        self._start_navigation()
+        await self._page.go_forward(wait_until='domcontentloaded')
+        waited = await self.wait_until_ready(config.readiness_navigation_timeout)
+        
+        # Drop page snapshot after navigation
+        self.invalidate_snapshot()
+        return waited
+        
+    def _start_navigation(self):
+        """Forget requests of the document being left: blocking stats and readiness tracking"""
+        self._request_filter.start_navigation()
+        if self._readiness:
+            self._readiness.start_navigation()
+        
+    async def wait_until_ready(self, timeout_ms: int) -> int:
+        """Wait until the page's DOM and document/XHR/fetch requests have been quiet
         
-        # Reset all page items after navigation
-        self.reset_text_items()
-        self.reset_buttons_items()
-        self.reset_links_items()
+        Args:
+            timeout_ms: Upper bound of the wait
+            
+        Returns:
+            Milliseconds actually waited
+        """
+        if not self._readiness:
+            err = BrowserClosedError("Wait for page")
+            log_error(err)
+            raise err
+        waited = await self._readiness.wait(timeout_ms)
+        if config.is_debug():
+            logger.debug(f"Page ready after {waited} ms (limit {timeout_ms} ms)")
+        return waited
         
     @property
     def page(self) -> Page:
@@ -132,105 +344,313 @@ class BrowserManager:
             raise err
         return self._page.url
     
-    # Text items methods
+    # Page snapshot methods
     
-    async def get_next_page_text_item(self) -> Optional[PageTextItem]:
-        """Get next portion of page text"""
+    async def get_snapshot(self) -> PageSnapshot:
+        """Get snapshot of current page
+        
+        The page is not re-parsed while its URL, document and DOM-change generation
+        stay the same. When only the DOM of the same document changed, the snapshot
+        is patched by re-extracting the changed subtrees.
+        """
         if not self._page:
             raise BrowserClosedError("Browser page is not available")
         
+        parser = self._create_parser()
         current_url = self._page.url
+        dom_state = await parser.read_dom_state()
         
-        if current_url != self._last_text_parsed_url or not self._text_items:
-            from parser.page_parser import PageParser
-            parser = PageParser(self._page)
-            self._text_items = await parser.parse_page_text_items()
-            self._current_text_index = 0
-            self._last_text_parsed_url = current_url
+        if self._snapshot and self._snapshot.is_valid_for(current_url, dom_state):
+            return self._snapshot
         
-        if self._current_text_index < len(self._text_items):
-            item = self._text_items[self._current_text_index]
+        self._snapshot_version += 1
+        snapshot = None
+        same_document = bool(self._snapshot and self._snapshot.is_same_document(current_url, dom_state))
+        
+        try:
+            if same_document:
+                snapshot = await parser.patch_snapshot(self._snapshot, self._snapshot_version)
+                if snapshot and config.is_debug():
+                    logger.debug(
+                        f"Patched page snapshot v{snapshot.version} for {current_url} "
+                        f"({snapshot.duplicates_dropped} duplicate elements dropped)"
+                    )
+            
+            if not snapshot:
+                snapshot = await parser.parse_snapshot(self._snapshot_version)
+                if config.is_debug():
+                    logger.debug(
+                        f"Parsed page snapshot v{snapshot.version} for {current_url} "
+                        f"({snapshot.duplicates_dropped} duplicate elements dropped)"
+                    )
+        finally:
+            await parser.release_handles()
+        
+        self._snapshot = snapshot
+        
+        if same_document:
+            # The page changed by itself (carousel, ticker, clock): keep paging where the agent is
+            self._current_text_index = min(self._current_text_index, len(snapshot.text_items))
+            self._current_buttons_index = min(self._current_buttons_index, snapshot.buttons_item_count)
+            self._current_links_index = min(self._current_links_index, len(snapshot.links_items))
+        else:
+            # Cursors of the previous document point into stale items
+            self.reset_text_items()
+            self.reset_buttons_items()
+            self.reset_links_items()
+        
+        return self._snapshot
+    
+    def _create_parser(self) -> "PageParser":
+        """Create page parser for the configured backend"""
+        boilerplate = self._boilerplate if config.collapse_boilerplate else None
+        if config.parser_backend == ParserBackend.CDP:
+            from parser.cdp_parser import CdpPageParser
+            return CdpPageParser(self._page, self._handles, boilerplate)
+        from parser.page_parser import PageParser
+        return PageParser(self._page, self._handles, boilerplate)
+    
+    @property
+    def live_handle_count(self) -> int:
+        """Parse-scoped handles and CDP sessions not released yet (non-zero between parses means a leak)
+        
+        Covers ElementHandles/JSHandles and CDP sessions opened by parsers (CDP
+        backend, accessibility mode) and by get_memory_usage. The default DOM path
+        runs in-page scripts and holds no handles, so it stays at zero there.
+        """
+        return self._handles.live_count
+    
+    def get_handle_stats(self) -> Dict[str, int]:
+        """Lifetime handle accounting
+        
+        Returns:
+            Dict with live, created and released counts of parse-scoped resources
+            (see live_handle_count), and session_live, session_created and
+            session_released for CDP sessions kept while the page lives: the
+            request filter's session, so session_live is 1 while blocking is on
+            and 0 once it is off or the context is closed. Page event listeners
+            (readiness tracking) are Python callbacks, not renderer resources,
+            and are not counted.
+        """
+        return {
+            'live': self._handles.live_count,
+            'created': self._handles.created,
+            'released': self._handles.released,
+            'session_live': self._session_handles.live_count,
+            'session_created': self._session_handles.created,
+            'session_released': self._session_handles.released
+        }
+    
+    async def _scroll_for_more(
+        self,
+        snapshot: PageSnapshot,
+        has_next: Callable[[PageSnapshot], bool]
+    ) -> bool:
+        """Scroll for lazily loaded content after the agent read the last item
+        
+        Scrolls one viewport at a time while every scroll adds new buttons,
+        inputs or links; the first scroll that adds none (static page, bottom
+        reached, only sticky-header style changes) exhausts scrolling for the
+        document, as does the per-document budget. The grown snapshot is patched
+        from the changed subtrees only; cursors move to the first items holding
+        new elements and otherwise keep their position.
+        
+        Args:
+            snapshot: Current snapshot, fully read by one of the cursors
+            has_next: Whether that cursor has an item left in given snapshot
+            
+        Returns:
+            True if the cursor has a new item to serve
+        """
+        if not config.scroll_streaming:
+            return False
+        budget = self._scroll_budget.for_document(snapshot.document_id)
+        
+        while budget.allows_scroll:
+            result = await self._create_parser().scroll_for_more(snapshot.generation)
+            budget.steps += 1
+            if config.is_debug():
+                logger.debug(
+                    f"Scroll step {budget.steps}/{budget.max_steps} on {snapshot.url}: "
+                    f"scrolled={result['scrolled']}, grown={result['grown']}"
+                )
+            
+            if not result['grown'] or not result['changed']:
+                budget.exhausted = True  # Nothing loads on scroll: do not wait again on this document
+                return False
+            
+            text_index = self._current_text_index
+            buttons_index = self._current_buttons_index
+            links_index = self._current_links_index
+            grown = await self.get_snapshot()
+            
+            if grown.url != snapshot.url or grown.document_id != snapshot.document_id:
+                return has_next(grown)  # Scrolling navigated away: cursors start over
+            
+            new_element_ids = (
+                (grown.buttons_internal.keys() | grown.inputs_internal.keys())
+                - (snapshot.buttons_internal.keys() | snapshot.inputs_internal.keys())
+            )
+            new_urls = {link.url for link in grown.links} - {link.url for link in snapshot.links}
+            budget.new_elements += len(new_element_ids) + len(new_urls)
+            if not new_element_ids and not new_urls:
+                budget.exhausted = True  # Added nodes were not buttons, inputs or links
+            
+            self._current_text_index = min(text_index, len(grown.text_items))
+            self._current_buttons_index = self._resume_index(
+                buttons_index, grown.buttons_item_count, grown.first_buttons_item_with(new_element_ids)
+            )
+            self._current_links_index = self._resume_index(
+                links_index, len(grown.links_items), grown.first_links_item_with(new_urls)
+            )
+            
+            if has_next(grown):
+                return True
+            snapshot = grown
+        
+        return False
+    
+    @staticmethod
+    def _resume_index(index: int, item_count: int, first_new: Optional[int]) -> int:
+        """Cursor position after the snapshot grew: unchanged unless new elements come earlier"""
+        if first_new is not None:
+            index = min(index, first_new)
+        return min(index, item_count)
+    
+    async def set_request_blocking(self, enabled: bool) -> None:
+        """Turn blocking of heavy resources and trackers on or off for this session"""
+        if not self._context or not self._page:
+            raise BrowserClosedError("Browser context is not available")
+        if enabled:
+            await self._request_filter.enable(self._context, self._page)
+        else:
+            await self._request_filter.disable()
+    
+    def get_blocking_stats(self) -> Dict[str, Any]:
+        """Blocked requests of the last navigation and of the whole session"""
+        return {
+            'enabled': self._request_filter.enabled,
+            'last_navigation': self._request_filter.navigation,
+            'total': self._request_filter.total
+        }
+    
+    async def get_memory_usage(self) -> int:
+        """JS heap used by the page's renderer, in bytes (Performance.getMetrics)"""
+        if not self._page:
+            raise BrowserClosedError("Browser page is not available")
+        
+        session = self._handles.track(await self._context.new_cdp_session(self._page))
+        try:
+            await session.send("Performance.enable")
+            result = await session.send("Performance.getMetrics")
+        finally:
+            # Only this session: handles of a parse running concurrently stay alive
+            await self._handles.release(session)
+        
+        metrics = {metric['name']: metric['value'] for metric in result['metrics']}
+        return int(metrics.get('JSHeapUsedSize', 0))
+    
+    def invalidate_snapshot(self):
+        """Drop current snapshot so the next page information request parses the page from scratch"""
+        self._snapshot = None
+    
+    # Text items methods
+    
+    async def get_next_page_text_item(self) -> Optional[PageTextItem]:
+        """Get next portion of page text"""
+        snapshot = await self.get_snapshot()
+        
+        if self._current_text_index < len(snapshot.text_items):
+            item = snapshot.text_items[self._current_text_index]
             self._current_text_index += 1
             return item
         
         return None
     
     def reset_text_items(self):
-        """Reset text items state"""
-        self._text_items = []
+        """Reset text items cursor"""
         self._current_text_index = 0
-        self._last_text_parsed_url = None
     
     # Buttons items methods
     
     async def get_next_page_buttons_item(self) -> Optional[PageButtonsItem]:
-        """Get next portion of buttons and input fields"""
-        if not self._page:
-            raise BrowserClosedError("Browser page is not available")
+        """Get next portion of buttons and input fields, scrolling for lazily loaded ones after the last"""
+        snapshot = await self.get_snapshot()
         
-        current_url = self._page.url
+        def has_next(current: PageSnapshot) -> bool:
+            return self._current_buttons_index < current.buttons_item_count
         
-        if current_url != self._last_buttons_parsed_url or not self._buttons_items:
-            from parser.page_parser import PageParser
-            parser = PageParser(self._page)
-            buttons_internal, inputs_internal, buttons_items = await parser.parse_page_buttons_items()
-            
-            # Store internal elements by ID
-            self._buttons_internal = {btn.id: btn for btn in buttons_internal}
-            self._inputs_internal = {inp.id: inp for inp in inputs_internal}
-            
-            self._buttons_items = buttons_items
-            self._current_buttons_index = 0
-            self._last_buttons_parsed_url = current_url
+        if not has_next(snapshot) and await self._scroll_for_more(snapshot, has_next):
+            snapshot = self._snapshot
         
-        if self._current_buttons_index < len(self._buttons_items):
-            item = self._buttons_items[self._current_buttons_index]
+        if has_next(snapshot):
+            item = snapshot.get_buttons_item(self._current_buttons_index)
             self._current_buttons_index += 1
             return item
         
         return None
     
     def reset_buttons_items(self):
-        """Reset buttons items state"""
-        self._buttons_items = []
+        """Reset buttons items cursor"""
         self._current_buttons_index = 0
-        self._last_buttons_parsed_url = None
-        self._buttons_internal = {}
-        self._inputs_internal = {}
     
     def get_button_by_id(self, button_id: int) -> Optional[ButtonInternal]:
         """Get internal button object by ID"""
-        return self._buttons_internal.get(button_id)
+        if not self._snapshot:
+            return None
+        return self._snapshot.get_button(button_id)
     
     def get_input_by_id(self, input_id: int) -> Optional[InputInternal]:
         """Get internal input object by ID"""
-        return self._inputs_internal.get(input_id)
+        if not self._snapshot:
+            return None
+        return self._snapshot.get_input(input_id)
+    
+    async def claim_element(self, element_id: int) -> bool:
+        """Make element's ID locator match a single element before acting on it
+        
+        Pages that clone nodes after a parse (loop carousels) copy the ID stamp;
+        the copies are renumbered so the strict locator does not match both.
+        
+        Returns:
+            Whether an element with the ID is still on the page
+        """
+        if not self._page:
+            raise BrowserClosedError("Browser page is not available")
+        try:
+            return await self._page.evaluate(CLAIM_ELEMENT_SCRIPT, element_id)
+        except PlaywrightError as e:
+            # Page navigating: the locator wait reports the missing element
+            if config.is_debug():
+                logger.debug(f"Claiming element {element_id} failed: {e}")
+            return False
     
     # Links items methods
     
     async def get_next_page_links_item(self) -> Optional[PageLinksItem]:
-        """Get next portion of links"""
-        if not self._page:
-            raise BrowserClosedError("Browser page is not available")
+        """Get next portion of links, scrolling for lazily loaded ones after the last"""
+        snapshot = await self.get_snapshot()
         
-        current_url = self._page.url
+        def has_next(current: PageSnapshot) -> bool:
+            return self._current_links_index < len(current.links_items)
         
-        if current_url != self._last_links_parsed_url or not self._links_items:
-            from parser.page_parser import PageParser
-            parser = PageParser(self._page)
-            self._links_items = await parser.parse_page_links_items()
-            self._current_links_index = 0
-            self._last_links_parsed_url = current_url
+        if not has_next(snapshot) and await self._scroll_for_more(snapshot, has_next):
+            snapshot = self._snapshot
         
-        if self._current_links_index < len(self._links_items):
-            item = self._links_items[self._current_links_index]
+        if has_next(snapshot):
+            item = snapshot.links_items[self._current_links_index]
             self._current_links_index += 1
             return item
         
         return None
     
     def reset_links_items(self):
-        """Reset links items state"""
-        self._links_items = []
+        """Reset links items cursor"""
         self._current_links_index = 0
-        self._last_links_parsed_url = None
+    
+    # Search methods
+    
+    async def search_page(self, query: str) -> PageSearchItem:
+        """Search text chunks, buttons, inputs and links of current page"""
+        snapshot = await self.get_snapshot()
+        return snapshot.search(query, config.search_top_k)
@@ -0,0 +1,217 @@
+"""
+Pool of isolated browser sessions on one shared Chromium process.
+Every agent session gets its own BrowserContext, page and BrowserManager
+(snapshot, cursors, boilerplate fingerprints), so concurrent tasks do not see
+each other's cookies or parse state. Idle sessions are recycled least recently
+used first when the pool is full, and on release when their page uses too
+much memory.
+
+The pool is a library entry point for hosts that serve several agent sessions
+from one process; the interactive CLI runs a single BrowserManager.
+Contexts are opened, probed and closed outside the pool lock, so one slow
+session does not stall the others.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+from playwright.async_api import Browser, Error as PlaywrightError
+
+from config import config
+from exceptions.browser_closed import BrowserClosedError
+from .browser_manager import BrowserManager, launch_browser
+
+
+class BrowserPool:
+    """Hands out one BrowserManager per session ID, at most `max_contexts` open at a time"""
+
+    def __init__(self):
+        self.max_contexts = config.pool_max_contexts
+        self.context_memory_cap = config.pool_context_memory_cap_mb * 1024 * 1024
+        self._stealth_context: Optional[Any] = None
+        self._browser: Optional[Browser] = None
+
+        # Open sessions, least recently used first, with their number of holders
+        self._managers: "OrderedDict[str, BrowserManager]" = OrderedDict()
+        self._leases: Dict[str, int] = {}
+        self._opening: Set[str] = set()  # Contexts being opened; not usable yet
+        self._condition = asyncio.Condition()
+
+        self.recycled = 0  # Contexts closed to make room or over the memory cap
+        self.startup_time_ms: Optional[float] = None  # Shared browser launch time
+
+    async def start(self) -> None:
+        """Launch the shared browser"""
+        started = time.perf_counter()
+        self._stealth_context, self._browser = await launch_browser()
+        self.startup_time_ms = (time.perf_counter() - started) * 1000
+
+    async def stop(self) -> None:
+        """Close every session context and the browser"""
+        async with self._condition:
+            closing = list(self._managers.items())
+            self._managers.clear()
+            self._leases.clear()
+            self._opening.clear()
+            self._condition.notify_all()
+        for session_id, manager in closing:
+            await self._close(session_id, manager)
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._stealth_context:
+            await self._stealth_context.__aexit__(None, None, None)
+            self._stealth_context = None
+
+    @property
+    def size(self) -> int:
+        """Number of open session contexts"""
+        return len(self._managers)
+
+    async def acquire(self, session_id: str) -> BrowserManager:
+        """Get the session's BrowserManager, opening a context for a new session
+
+        Every acquire() takes a lease that must be returned with release(); the
+        session counts as idle only when all its leases are returned. When the
+        pool is full, the least recently used idle session is closed; if every
+        session is in use, waits until one is released.
+
+        Args:
+            session_id: Agent session identifier
+
+        Returns:
+            BrowserManager with an open page
+        """
+        if not self._browser:
+            raise BrowserClosedError("Browser pool is not started")
+
+        evicted: List[Tuple[str, BrowserManager]] = []
+        async with self._condition:
+            while True:
+                if session_id in self._opening:
+                    await self._condition.wait()  # Another holder is opening this session
+                    continue
+                manager = self._managers.get(session_id)
+                if manager is not None:
+                    self._leases[session_id] = self._leases.get(session_id, 0) + 1
+                    self._managers.move_to_end(session_id)
+                    return manager
+                if len(self._managers) < self.max_contexts:
+                    break
+                idle = self._pop_idle()
+                if idle:
+                    evicted.append(idle)
+                else:
+                    await self._condition.wait()
+
+            # Reserve the slot, then do the slow work without holding the lock
+            manager = BrowserManager()
+            self._managers[session_id] = manager
+            self._leases[session_id] = 1
+            self._opening.add(session_id)
+
+        for evicted_id, evicted_manager in evicted:
+            await self._close(evicted_id, evicted_manager)
+
+        try:
+            await manager.open_context(self._browser)
+        except BaseException:
+            async with self._condition:
+                self._opening.discard(session_id)
+                if self._managers.get(session_id) is manager:
+                    del self._managers[session_id]
+                    self._leases.pop(session_id, None)
+                self._condition.notify_all()
+            raise
+
+        async with self._condition:
+            self._opening.discard(session_id)
+            self._condition.notify_all()
+        return manager
+
+    async def release(self, session_id: str) -> None:
+        """Return one lease; an idle session whose page is over the memory cap is closed"""
+        async with self._condition:
+            leases = self._leases.get(session_id, 0) - 1
+            if leases > 0:
+                self._leases[session_id] = leases
+                return
+            self._leases.pop(session_id, None)
+            manager = self._managers.get(session_id)
+            self._condition.notify_all()
+        if manager is None:
+            return
+
+        over_cap = await self._over_memory_cap(session_id, manager)
+
+        async with self._condition:
+            # Re-acquired or already recycled while memory was measured: leave it
+            if not over_cap or session_id in self._leases or self._managers.get(session_id) is not manager:
+                return
+            del self._managers[session_id]
+            self.recycled += 1
+            self._condition.notify_all()
+        await self._close(session_id, manager)
+
+    async def close_session(self, session_id: str) -> None:
+        """Close session context when the session ends"""
+        async with self._condition:
+            while session_id in self._opening:
+                await self._condition.wait()
+            self._leases.pop(session_id, None)
+            manager = self._managers.pop(session_id, None)
+            self._condition.notify_all()
+        if manager is not None:
+            await self._close(session_id, manager)
+
+    @asynccontextmanager
+    async def session(self, session_id: str) -> AsyncIterator[BrowserManager]:
+        """acquire() for the duration of a block, then release()"""
+        manager = await self.acquire(session_id)
+        try:
+            yield manager
+        finally:
+            await self.release(session_id)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Open, in-use and recycled context counts"""
+        return {
+            'open': len(self._managers),
+            'in_use': len(self._leases),
+            'recycled': self.recycled,
+            'max': self.max_contexts
+        }
+
+    def _pop_idle(self) -> Optional[Tuple[str, BrowserManager]]:
+        """Take the least recently used idle session out of the pool; None if all are in use"""
+        for session_id in self._managers:
+            if session_id not in self._leases:
+                self.recycled += 1
+                return session_id, self._managers.pop(session_id)
+        return None
+
+    async def _over_memory_cap(self, session_id: str, manager: BrowserManager) -> bool:
+        try:
+            used = await manager.get_memory_usage()
+        except (PlaywrightError, BrowserClosedError) as e:
+            # A page that cannot report its memory (crashed or closed) is not worth keeping
+            if config.is_debug():
+                logger.debug(f"Memory check failed for session {session_id}: {e}")
+            return True
+        if used > self.context_memory_cap:
+            if config.is_debug():
+                logger.debug(f"Session {session_id} uses {used // (1024 * 1024)} MB of JS heap, recycling")
+            return True
+        return False
+
+    async def _close(self, session_id: str, manager: BrowserManager) -> None:
+        try:
+            await manager.close_context()
+        except PlaywrightError as e:
+            # Context already gone with a crashed page
+            if config.is_debug():
+                logger.debug(f"Closing context of session {session_id} failed: {e}")
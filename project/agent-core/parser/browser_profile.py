@@ -0,0 +1,159 @@
+"""
+Browser profiles kept between runs.
+A profile is either a Chromium user-data-dir (cookies, storage and the HTTP
+cache, so repeat tasks on the same sites start warm) or a storage_state JSON
+file (cookies and local storage only). Profiles unused for a while are
+deleted; a user-data-dir over the size cap loses its regenerable caches
+first and is deleted as a whole only if that is not enough.
+"""
+
+import os
+import shutil
+import socket
+import time
+from pathlib import Path
+from typing import List
+
+from config import is_valid_profile_name
+
+# Touched on every use of a user-data-dir: Chromium rewrites files deep inside
+# the directory, so its own mtime does not tell when it was last used
+_LAST_USED_MARKER = '.last_used'
+
+# Created by Chromium in a user-data-dir it runs on: a symlink to "<host>-<pid>"
+# on Linux and macOS, a locked file on Windows
+_CHROMIUM_LOCKS = ['SingletonLock', 'lockfile']
+
+# Caches inside a user-data-dir that Chromium rebuilds on demand
+CACHE_DIRS = [
+    'Default/Cache',
+    'Default/Code Cache',
+    'Default/GPUCache',
+    'Default/Service Worker/CacheStorage',
+    'Default/Service Worker/ScriptCache',
+    'GrShaderCache',
+    'GraphiteDawnCache',
+    'ShaderCache'
+]
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    return True
+
+
+def is_profile_locked(path: Path) -> bool:
+    """Whether a Chromium process is using the user-data-dir
+
+    A lock left behind by a crashed Chromium on this host is recognized by its
+    dead PID and does not count.
+    """
+    for lock_name in _CHROMIUM_LOCKS:
+        lock = path / lock_name
+        if not os.path.lexists(lock):
+            continue
+        if not lock.is_symlink():
+            return True
+        host, _, pid = os.readlink(lock).rpartition('-')
+        if host != socket.gethostname() or not pid.isdigit() or _pid_alive(int(pid)):
+            return True
+    return False
+
+
+def directory_size(path: Path) -> int:
+    """Total size of files under path, in bytes"""
+    size = 0
+    for file in path.rglob('*'):
+        try:
+            if file.is_file():
+                size += file.stat().st_size
+        except OSError:
+            continue  # Removed while walking
+    return size
+
+
+class BrowserProfileStore:
+    """Profiles under one root directory: `<name>/` user-data-dirs and `<name>.json` storage states"""
+
+    def __init__(self, root: str, max_size_mb: int, max_age_days: int):
+        self.root = Path(root)
+        self.max_size = max_size_mb * 1024 * 1024
+        self.max_age = max_age_days * 24 * 60 * 60
+
+    def user_data_dir(self, name: str) -> Path:
+        """Directory of a persistent Chromium profile, created on first use"""
+        path = self._profile_path(name)
+        path.mkdir(parents=True, exist_ok=True)
+        (path / _LAST_USED_MARKER).touch()
+        return path
+
+    def storage_state_path(self, name: str) -> Path:
+        """Storage state file of a profile (may not exist yet)"""
+        self.root.mkdir(parents=True, exist_ok=True)
+        return self._profile_path(name).with_name(f"{name}.json")
+
+    def cleanup(self, active: str) -> List[str]:
+        """Delete profiles unused for longer than max age and enforce the size cap of the active one
+
+        Profiles a Chromium process holds (another agent instance) are left
+        alone; other profiles are only trimmed by the run that uses them.
+
+        Args:
+            active: Profile about to be used; never deleted for age
+
+        Returns:
+            Descriptions of removed and trimmed profiles
+        """
+        if not self.root.is_dir():
+            return []
+
+        actions = []
+        now = time.time()
+        for entry in sorted(self.root.iterdir()):
+            if entry.is_dir() and is_profile_locked(entry):
+                continue
+            name = entry.stem if entry.suffix == '.json' else entry.name
+            if name != active and now - self._last_used(entry) > self.max_age:
+                self._remove(entry)
+                actions.append(f"{entry.name}: unused, removed")
+            elif name == active and entry.is_dir():
+                action = self.enforce_size_cap(entry)
+                if action:
+                    actions.append(f"{entry.name}: {action}")
+        return actions
+
+    def enforce_size_cap(self, path: Path) -> str:
+        """Drop caches of a user-data-dir over the size cap, then the whole directory
+
+        Returns:
+            What was done, empty if the profile fits or a Chromium process holds it
+        """
+        if is_profile_locked(path) or directory_size(path) <= self.max_size:
+            return ''
+        for cache_dir in CACHE_DIRS:
+            shutil.rmtree(path / cache_dir, ignore_errors=True)
+        if directory_size(path) <= self.max_size:
+            return 'over size cap, caches cleared'
+        self._remove(path)
+        return 'over size cap without caches, removed'
+
+    def _profile_path(self, name: str) -> Path:
+        """Path of a profile, refusing names that would leave the root directory"""
+        if not is_valid_profile_name(name):
+            raise ValueError(f"Invalid browser profile name '{name}'")
+        return self.root / name
+
+    def _last_used(self, entry: Path) -> float:
+        marker = entry / _LAST_USED_MARKER
+        return (marker if marker.exists() else entry).stat().st_mtime
+
+    def _remove(self, entry: Path) -> None:
+        if entry.is_dir():
+            shutil.rmtree(entry, ignore_errors=True)
+        else:
+            entry.unlink(missing_ok=True)
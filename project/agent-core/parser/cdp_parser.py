@@ -0,0 +1,250 @@
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+from playwright.async_api import Page
+
+from config import config, TextMode
+from models.button import Button, ButtonInternal
+from models.link import Link
+from models.input_field import Input, InputInternal
+from .page_parser import PageParser, BUTTON_SELECTORS, INPUT_SELECTORS
+from .page_snapshot import PageSnapshot
+from .dom_snapshot import DomSnapshotDocument, ELEMENT_NODE, capture_dom_snapshot
+from .boilerplate import BoilerplateRegistry
+from .handle_tracker import HandleTracker
+from .scripts import ELEMENT_TEXT_LIMIT, PARENT_TEXT_LIMIT, element_selector
+
+
+# Attribute-level equivalents of BUTTON_SELECTORS and INPUT_SELECTORS,
+# so element indexes match `document.querySelectorAll(selector)[index]`
+SelectorMatcher = Callable[[str, Dict[str, str]], bool]
+
+SELECTOR_MATCHERS: Dict[str, SelectorMatcher] = {
+    'button': lambda tag, attrs: tag == 'BUTTON',
+    '[role="button"]': lambda tag, attrs: attrs.get('role') == 'button',
+    'input[type="submit"]': lambda tag, attrs: tag == 'INPUT' and attrs.get('type', '').lower() == 'submit',
+    'input[type="button"]': lambda tag, attrs: tag == 'INPUT' and attrs.get('type', '').lower() == 'button',
+    'input[type="text"]': lambda tag, attrs: tag == 'INPUT' and attrs.get('type', '').lower() == 'text',
+    'input[type="email"]': lambda tag, attrs: tag == 'INPUT' and attrs.get('type', '').lower() == 'email',
+    'input[type="password"]': lambda tag, attrs: tag == 'INPUT' and attrs.get('type', '').lower() == 'password',
+    'input[type="search"]': lambda tag, attrs: tag == 'INPUT' and attrs.get('type', '').lower() == 'search',
+    'input[type="tel"]': lambda tag, attrs: tag == 'INPUT' and attrs.get('type', '').lower() == 'tel',
+    'input[type="url"]': lambda tag, attrs: tag == 'INPUT' and attrs.get('type', '').lower() == 'url',
+    'input:not([type])': lambda tag, attrs: tag == 'INPUT' and 'type' not in attrs,
+    'textarea': lambda tag, attrs: tag == 'TEXTAREA',
+}
+
+
+class CdpPageParser(PageParser):
+    """PageParser backend built on Chrome DevTools Protocol DOMSnapshot.
+
+    The whole DOM with layout and computed styles is captured by one
+    DOMSnapshot.captureSnapshot call, and buttons, inputs, links and visible
+    text are read from its flattened arrays. This avoids page.evaluate
+    serialization limits on very large documents.
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        handles: Optional[HandleTracker] = None,
+        boilerplate: Optional[BoilerplateRegistry] = None
+    ):
+        super().__init__(page, handles, boilerplate)
+        self._document: Optional[DomSnapshotDocument] = None
+
+    async def capture(self) -> DomSnapshotDocument:
+        """Capture DOMSnapshot of the main document"""
+        self._document = await capture_dom_snapshot(await self.cdp_session())
+        return self._document
+
+    async def parse_snapshot(self, version: int) -> PageSnapshot:
+        """Capture DOMSnapshot once and build all page items from it"""
+        await self.capture()
+        return await super().parse_snapshot(version)
+
+    async def patch_snapshot(self, snapshot: PageSnapshot, version: int) -> Optional[PageSnapshot]:
+        """DOMSnapshot has no dirty-region tracking, so changes always need a full parse
+
+        Element IDs still survive it: they are stamped on the nodes and reused.
+        """
+        return None
+
+    async def _get_document(self) -> DomSnapshotDocument:
+        if self._document is None:
+            return await self.capture()
+        return self._document
+
+    def _match_selectors(
+        self,
+        document: DomSnapshotDocument,
+        selectors: List[str]
+    ) -> List[Tuple[str, int, int, str, Dict[str, str]]]:
+        """Find elements matching selectors as (selector, nth index, node, tag, attrs)
+
+        A node matched by several selectors is returned once, for the first of them,
+        and counted in `duplicates_dropped`.
+        """
+        matches = {selector: [] for selector in selectors}
+        counters = {selector: 0 for selector in selectors}
+
+        for node, node_type in enumerate(document.node_type):
+            if node_type != ELEMENT_NODE or document.in_shadow_tree[node]:
+                continue
+            tag = document.tag(node)
+            if tag not in ('BUTTON', 'INPUT', 'TEXTAREA') and not document.attributes[node]:
+                continue
+            attrs = document.attrs(node)
+            for selector in selectors:
+                if SELECTOR_MATCHERS[selector](tag, attrs):
+                    matches[selector].append((selector, counters[selector], node, tag, attrs))
+                    counters[selector] += 1
+
+        result = []
+        seen = set()
+        for selector in selectors:
+            for match in matches[selector]:
+                node = match[2]
+                if node in seen:
+                    if document.box_center(node):
+                        self.duplicates_dropped += 1
+                    continue
+                seen.add(node)
+                result.append(match)
+        return result
+
+    async def _stamp_matches(
+        self,
+        document: DomSnapshotDocument,
+        selectors: List[str]
+    ) -> List[Tuple[int, str, int, Dict[str, str]]]:
+        """Match visible elements and tag them with IDs as (element ID, selector, node, attrs)"""
+        matches = [
+            (selector, index, node, attrs)
+            for selector, index, node, tag, attrs in self._match_selectors(document, selectors)
+            if document.box_center(node)
+        ]
+        element_ids = await self.stamp_elements([(selector, index) for selector, index, _, _ in matches])
+
+        return [
+            (element_id, selector, node, attrs)
+            for element_id, (selector, index, node, attrs) in zip(element_ids, matches)
+            if element_id is not None
+        ]
+
+    def _parent_text(self, document: DomSnapshotDocument, node: int) -> Optional[str]:
+        parent = document.parent_index[node]
+        if parent < 0:
+            return None
+        return document.text_content(parent, PARENT_TEXT_LIMIT) or None
+
+    async def get_visible_text(self) -> str:
+        """Extract visible text from snapshot layout text runs (main content mode reads it in-page)"""
+        if config.text_mode == TextMode.MAIN_CONTENT:
+            return await super().get_visible_text()
+        document = await self._get_document()
+        return document.visible_text().strip()
+
+    async def extract_buttons(self) -> Tuple[List[ButtonInternal], List[Button]]:
+        """Extract buttons from DOMSnapshot arrays"""
+        document = await self._get_document()
+        buttons_internal = []
+        buttons_external = []
+
+        for element_id, selector, node, attrs in await self._stamp_matches(document, BUTTON_SELECTORS):
+            position = document.box_center(node)
+
+            text = document.text_content(node, ELEMENT_TEXT_LIMIT)
+            if not text:
+                text = attrs.get('value', '').strip()[:ELEMENT_TEXT_LIMIT]
+            parent_text = self._parent_text(document, node)
+
+            locator = self.page.locator(element_selector(element_id))
+
+            buttons_internal.append(ButtonInternal(
+                element_id=element_id,
+                element=locator,
+                text=text,
+                position=position,
+                parent_text=parent_text
+            ))
+
+            buttons_external.append(Button.model_construct(
+                id=element_id,
+                text=text,
+                position=position,
+                parent_text=parent_text
+            ))
+
+        return buttons_internal, buttons_external
+
+    async def extract_inputs(self) -> Tuple[List[InputInternal], List[Input]]:
+        """Extract input fields from DOMSnapshot arrays"""
+        document = await self._get_document()
+        inputs_internal = []
+        inputs_external = []
+
+        for element_id, selector, node, attrs in await self._stamp_matches(document, INPUT_SELECTORS):
+            position = document.box_center(node)
+
+            input_type = attrs.get('type') or 'text'
+            if selector == 'textarea':
+                input_type = 'textarea'
+            name = attrs.get('name', '')
+            placeholder = attrs.get('placeholder', '')
+            parent_text = self._parent_text(document, node)
+
+            locator = self.page.locator(element_selector(element_id))
+
+            inputs_internal.append(InputInternal(
+                element_id=element_id,
+                element=locator,
+                input_type=input_type,
+                name=name,
+                placeholder=placeholder,
+                position=position,
+                parent_text=parent_text
+            ))
+
+            inputs_external.append(Input.model_construct(
+                id=element_id,
+                input_type=input_type,
+                name=name,
+                placeholder=placeholder,
+                position=position,
+                parent_text=parent_text
+            ))
+
+        return inputs_internal, inputs_external
+
+    async def extract_links(self) -> List[Link]:
+        """Extract links from DOMSnapshot arrays, with the same filtering as the in-page script"""
+        document = await self._get_document()
+        links = []
+        seen = set()
+
+        for node, node_type in enumerate(document.node_type):
+            if node_type != ELEMENT_NODE or document.in_shadow_tree[node] or document.tag(node) != 'A':
+                continue
+            href = document.attrs(node).get('href', '').strip()
+            if not href or href.startswith('#'):
+                continue
+            protocol = ''.join(href.lower().split())
+            if protocol.startswith(('javascript:', 'mailto:')):
+                continue
+
+            url = urljoin(document.base_url, href)
+            if url in seen or not document.box_center(node):
+                continue
+
+            text = document.text_content(node, ELEMENT_TEXT_LIMIT)
+            if not text:
+                text = document.attrs(node).get('aria-label', '').strip()[:ELEMENT_TEXT_LIMIT]
+
+            seen.add(url)
+            links.append(Link.model_construct(
+                text=text,
+                url=url,
+                parent_text=self._parent_text(document, node)
+            ))
+
+        return links
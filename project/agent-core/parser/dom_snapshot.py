@@ -0,0 +1,190 @@
+"""
+Decoding of Chrome DevTools Protocol DOMSnapshot.captureSnapshot responses.
+The snapshot is a set of flattened arrays indexed by node; DomSnapshotDocument
+wraps the main document and answers the questions parsers ask about a node.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+from playwright.async_api import CDPSession
+
+ELEMENT_NODE = 1
+TEXT_NODE = 3
+CDATA_SECTION_NODE = 4
+DOCUMENT_FRAGMENT_NODE = 11
+
+# Computed styles requested from DOMSnapshot, in this order
+SNAPSHOT_STYLES = ['display', 'visibility']
+
+# Display values that do not start a new line in innerText
+INLINE_DISPLAYS = ('inline', 'inline-block', 'inline-flex', 'inline-grid', 'contents')
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+class DomSnapshotDocument:
+    """Decoded main document of a DOMSnapshot.captureSnapshot response.
+    Keeps the flattened node/layout arrays and resolves string table indexes lazily."""
+
+    def __init__(self, response: Dict):
+        self.strings: List[str] = response['strings']
+        document = response['documents'][0]
+
+        nodes = document['nodes']
+        self.parent_index: List[int] = nodes['parentIndex']
+        self.node_type: List[int] = nodes['nodeType']
+        self.node_name: List[int] = nodes['nodeName']
+        self.node_value: List[int] = nodes['nodeValue']
+        self.attributes: List[List[int]] = nodes['attributes']
+        self.backend_node_id: List[int] = nodes['backendNodeId']
+        self.clickable: List[int] = nodes.get('isClickable', {}).get('index', [])
+        self._backend_index: Optional[Dict[int, int]] = None
+
+        self.url = self.strings[document['documentURL']]
+        base_url = document.get('baseURL', -1)
+        self.base_url = self.strings[base_url] if base_url >= 0 else self.url
+
+        self.children: List[List[int]] = [[] for _ in self.parent_index]
+        for index, parent in enumerate(self.parent_index):
+            if parent >= 0:
+                self.children[parent].append(index)
+
+        # 1-based position of every element among its element siblings, for :nth-child()
+        self.element_position: Dict[int, int] = {}
+        for child_list in self.children:
+            position = 0
+            for child in child_list:
+                if self.node_type[child] == ELEMENT_NODE:
+                    position += 1
+                    self.element_position[child] = position
+
+        # Nodes inside shadow trees are not indexed by plain CSS queries
+        self.in_shadow_tree: List[bool] = [False] * len(self.parent_index)
+        for index, parent in enumerate(self.parent_index):
+            if parent >= 0:
+                self.in_shadow_tree[index] = self.in_shadow_tree[parent] or (
+                    self.node_type[index] == DOCUMENT_FRAGMENT_NODE and self.node_type[parent] == ELEMENT_NODE
+                )
+
+        layout = document['layout']
+        self.layout_index: Dict[int, int] = {node: i for i, node in enumerate(layout['nodeIndex'])}
+        self.bounds: List[List[float]] = layout['bounds']
+        self.styles: List[List[int]] = layout['styles']
+        self.layout_text: List[int] = layout['text']
+        self.layout_nodes: List[int] = layout['nodeIndex']
+
+    def string(self, index: int) -> str:
+        """Resolve string table index (-1 means absent)"""
+        return self.strings[index] if index >= 0 else ''
+
+    def tag(self, node: int) -> str:
+        return self.strings[self.node_name[node]]
+
+    def attrs(self, node: int) -> Dict[str, str]:
+        flat = self.attributes[node]
+        return {
+            self.strings[flat[i]].lower(): self.strings[flat[i + 1]]
+            for i in range(0, len(flat) - 1, 2)
+        }
+
+    def style(self, node: int, name: str) -> str:
+        layout = self.layout_index.get(node)
+        if layout is None:
+            return ''
+        return self.string(self.styles[layout][SNAPSHOT_STYLES.index(name)])
+
+    def box_center(self, node: int) -> Optional[Tuple[float, float]]:
+        """Center of visible element in document coordinates, None if element is not visible
+
+        Layout bounds are relative to the document, so positions do not depend on
+        how far the page is scrolled, as with the locator backend.
+        """
+        layout = self.layout_index.get(node)
+        if layout is None:
+            return None
+        x, y, width, height = self.bounds[layout]
+        if width == 0 or height == 0:
+            return None
+        if self.style(node, 'visibility') in ('hidden', 'collapse'):
+            return None
+        return (x + width / 2, y + height / 2)
+
+    def node_by_backend_id(self, backend_node_id: int) -> Optional[int]:
+        """Find snapshot node index by DevTools backend node ID"""
+        if self._backend_index is None:
+            self._backend_index = {backend: node for node, backend in enumerate(self.backend_node_id)}
+        return self._backend_index.get(backend_node_id)
+
+    def css_path(self, node: int) -> Optional[str]:
+        """Structural CSS selector (html > body:nth-child(2) > ...) for light DOM element"""
+        if self.in_shadow_tree[node]:
+            return None
+        steps = []
+        current = node
+        while current >= 0 and self.node_type[current] == ELEMENT_NODE:
+            tag = self.tag(current).lower()
+            parent = self.parent_index[current]
+            if parent >= 0 and self.node_type[parent] == ELEMENT_NODE:
+                steps.append(f"{tag}:nth-child({self.element_position[current]})")
+            else:
+                steps.append(tag)
+            current = parent
+        return ' > '.join(reversed(steps))
+
+    def text_content(self, node: int, limit: int) -> str:
+        """textContent of node with whitespace runs collapsed, stripped and truncated to limit characters"""
+        text = ''
+        stack = [node]
+        while stack and len(text) <= limit:
+            current = stack.pop()
+            node_type = self.node_type[current]
+            if node_type in (TEXT_NODE, CDATA_SECTION_NODE):
+                chunk = _WHITESPACE.sub(' ', self.string(self.node_value[current]))
+                if not text or text.endswith(' '):
+                    chunk = chunk[1:] if chunk.startswith(' ') else chunk
+                text += chunk
+            elif node_type == ELEMENT_NODE:
+                stack.extend(reversed(self.children[current]))
+        return text.strip()[:limit]
+
+    def block_ancestor(self, node: int) -> int:
+        """Nearest ancestor that is laid out as a block"""
+        current = self.parent_index[node]
+        while current >= 0 and self.style(current, 'display') in INLINE_DISPLAYS:
+            current = self.parent_index[current]
+        return current
+
+    def visible_text(self) -> str:
+        """Approximation of document.body.innerText built from layout text runs"""
+        lines = []
+        line_parts: List[str] = []
+        current_block = None
+
+        for layout, node in sorted(enumerate(self.layout_nodes), key=lambda pair: pair[1]):
+            if self.node_type[node] != TEXT_NODE:
+                continue
+            text = self.string(self.layout_text[layout])
+            if not text.strip():
+                continue
+            if self.style(self.parent_index[node], 'visibility') in ('hidden', 'collapse'):
+                continue
+
+            block = self.block_ancestor(node)
+            if block != current_block and line_parts:
+                lines.append(''.join(line_parts))
+                line_parts = []
+            current_block = block
+            line_parts.append(text)
+
+        if line_parts:
+            lines.append(''.join(line_parts))
+
+        return '\n'.join(' '.join(line.split()) for line in lines)
+
+
+async def capture_dom_snapshot(session: CDPSession) -> DomSnapshotDocument:
+    """Capture DOMSnapshot of the main document through an open CDP session"""
+    response = await session.send("DOMSnapshot.captureSnapshot", {
+        "computedStyles": SNAPSHOT_STYLES
+    })
+    return DomSnapshotDocument(response)
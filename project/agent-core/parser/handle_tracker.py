@@ -0,0 +1,65 @@
+"""
+Ownership of renderer-side resources created while parsing a page.
+JSHandles/ElementHandles and CDP sessions keep objects alive in Chromium until
+they are disposed or detached, so every one the parser creates is registered
+here and released in bulk when the parse ends.
+"""
+
+from typing import List, TypeVar, Union
+from playwright.async_api import CDPSession, JSHandle, Error as PlaywrightError
+
+from loguru import logger
+
+from config import config
+
+TrackedResource = Union[JSHandle, CDPSession]
+R = TypeVar('R', JSHandle, CDPSession)
+
+
+class HandleTracker:
+    """Registry of live handles and CDP sessions with leak accounting.
+
+    `live_count` must return to zero after every parse; `created` and
+    `released` are lifetime totals for the browser session.
+    """
+
+    def __init__(self):
+        self._live: List[TrackedResource] = []
+        self.created = 0
+        self.released = 0
+
+    @property
+    def live_count(self) -> int:
+        """Number of tracked resources not released yet"""
+        return len(self._live)
+
+    def track(self, resource: R) -> R:
+        """Take ownership of handle or CDP session"""
+        self._live.append(resource)
+        self.created += 1
+        return resource
+
+    async def release(self, resource: TrackedResource) -> None:
+        """Dispose or detach one resource, leaving the others tracked"""
+        if resource not in self._live:
+            return  # Already released in bulk
+        self._live.remove(resource)
+        await self._dispose(resource)
+
+    async def release_all(self) -> None:
+        """Dispose all handles and detach all CDP sessions, newest first"""
+        resources, self._live = self._live, []
+        for resource in reversed(resources):
+            await self._dispose(resource)
+
+    async def _dispose(self, resource: TrackedResource) -> None:
+        try:
+            if isinstance(resource, CDPSession):
+                await resource.detach()
+            else:
+                await resource.dispose()
+        except PlaywrightError as e:
+            # Page or browser already closed: the resource is gone with it
+            if config.is_debug():
+                logger.debug(f"Handle release skipped: {e}")
+        self.released += 1
@@ -1,27 +1,110 @@
-from typing import List, Optional, Tuple
-from playwright.async_api import Page, Locator
+import asyncio
+from typing import Any, Awaitable, Dict, List, Optional, Set, Tuple, Union
+from playwright.async_api import CDPSession, FrameLocator, Locator, Page
 
+from config import config, InteractiveSource, TextMode
 from models.button import Button, ButtonInternal
 from models.link import Link
 from models.input_field import Input, InputInternal
-from models.page import PageTextItem, PageButtonsItem, PageLinksItem
+from models.page import PageTextItem, PageLinksItem
+from .accessibility import collect_accessible_elements
+from .dom_snapshot import capture_dom_snapshot
+from .boilerplate import BoilerplateRegistry
+from .handle_tracker import HandleTracker
+from .page_snapshot import PageSnapshot
+from .text_chunker import TextChunker, estimate_tokens
+from .scripts import (
+    DOM_STATE_SCRIPT,
+    EXTRACT_BUTTONS_SCRIPT,
+    EXTRACT_INPUTS_SCRIPT,
+    EXTRACT_LINKS_SCRIPT,
+    EXTRACT_MAIN_CONTENT_SCRIPT,
+    PATCH_ELEMENTS_SCRIPT,
+    SCROLL_FOR_MORE_SCRIPT,
+    STAMP_ELEMENTS_SCRIPT,
+    element_selector
+)
+
+
+# Element kinds handled alike by incremental patching
+InternalElement = Union[ButtonInternal, InputInternal]
+Element = Union[Button, Input]
+
+BUTTON_SELECTORS = [
+    'button',
+    '[role="button"]',
+    'input[type="submit"]',
+    'input[type="button"]'
+]
+
+INPUT_SELECTORS = [
+    'input[type="text"]',
+    'input[type="email"]',
+    'input[type="password"]',
+    'input[type="search"]',
+    'input[type="tel"]',
+    'input[type="url"]',
+    'input:not([type])',
+    'textarea'
+]
+
+# Separates main content from the rest of page text in TextMode.MAIN_CONTENT
+OTHER_CONTENT_MARKER = "[Other page content: navigation, sidebars, footer]"
 
 
 class PageParser:
     """Parses webpage and extracts structured information with pagination support"""
     
-    def __init__(self, page: Page):
+    def __init__(
+        self,
+        page: Page,
+        handles: Optional[HandleTracker] = None,
+        boilerplate: Optional[BoilerplateRegistry] = None
+    ):
         self.page = page
-        self._element_id_counter = 0
+        self.text_chunker = TextChunker(config.text_chunk_tokens, config.text_token_counter or estimate_tokens)
+        
+        # Cross-page boilerplate of the browser session; None disables collapsing
+        self.boilerplate = boilerplate
+        
+        # Renderer-side resources of the current parse, released by release_handles()
+        self.handles = handles or HandleTracker()
+        self._cdp_session: Optional[CDPSession] = None
+        self._cdp_session_lock = asyncio.Lock()
+        
+        # Nodes matched by several selectors and dropped during the current parse
+        self.duplicates_dropped = 0
+    
+    async def cdp_session(self) -> CDPSession:
+        """CDP session shared by all protocol calls of the current parse"""
+        async with self._cdp_session_lock:
+            if self._cdp_session is None:
+                session = await self.page.context.new_cdp_session(self.page)
+                self._cdp_session = self.handles.track(session)
+        return self._cdp_session
     
-    def _generate_element_id(self) -> int:
-        """Generate unique element ID"""
-        element_id = self._element_id_counter
-        self._element_id_counter += 1
-        return element_id
+    async def release_handles(self) -> None:
+        """Release every handle and CDP session created by this parser"""
+        self._cdp_session = None
+        await self.handles.release_all()
+    
+    async def stamp_elements(self, targets: List[Tuple[str, int]]) -> List[Optional[int]]:
+        """Tag elements found outside the in-page runtime with stable IDs
+        
+        Args:
+            targets: (selector, nth match) pairs addressing the elements
+            
+        Returns:
+            Element ID for every target, None where the element is gone
+        """
+        if not targets:
+            return []
+        return await self.page.evaluate(STAMP_ELEMENTS_SCRIPT, [list(target) for target in targets])
     
     async def get_visible_text(self) -> str:
-        """Extract all visible text from the page"""
+        """Extract all visible text from the page (main content first in TextMode.MAIN_CONTENT)"""
+        if config.text_mode == TextMode.MAIN_CONTENT:
+            return await self.get_main_content_text()
         try:
             text = await self.page.evaluate("""
                 () => {
@@ -33,409 +116,462 @@ class PageParser:
         except Exception:
             return ""
     
+    async def get_main_content_text(self) -> str:
+        """Extract visible text with the detected main content moved to the front
+        
+        Main content is chosen in-page by readability-style scoring of text and
+        link density. Everything else (navigation, footers, sidebars, banners)
+        follows after OTHER_CONTENT_MARKER, so it lands in the last text items.
+        """
+        try:
+            result = await self.page.evaluate(EXTRACT_MAIN_CONTENT_SCRIPT)
+        except Exception:
+            return ""
+        
+        main = result['main'].strip()
+        rest = result['rest'].strip()
+        if not main or not rest:
+            return main or rest
+        return f"{main}\n\n{OTHER_CONTENT_MARKER}\n\n{rest}"
+    
     async def extract_buttons(self) -> Tuple[List[ButtonInternal], List[Button]]:
-        """Extract buttons: internal (with Playwright elements) and external (for agent)"""
+        """Extract buttons: internal (with Playwright elements) and external (for agent)
+        
+        All selectors are evaluated by one in-page script, so the cost is a single
+        round-trip regardless of how many buttons the page has. IDs are stamped
+        on the nodes as an attribute and stay the same across re-parses.
+        """
+        result = await self.page.evaluate(EXTRACT_BUTTONS_SCRIPT, BUTTON_SELECTORS)
+        self.duplicates_dropped += result['duplicates']
+        return self._buttons_from_records(result['records'])
+    
+    def _element_locator(self, record: Dict[str, Any]) -> Locator:
+        """Resolve extracted element by its ID attribute inside its frame
+        
+        Playwright CSS selectors pierce open shadow roots; same-origin frames
+        are entered through the IDs stamped on their frame elements.
+        """
+        scope: Union[Page, FrameLocator] = self.page
+        for frame_id in record.get('frame', []):
+            scope = scope.frame_locator(element_selector(frame_id))
+        return scope.locator(element_selector(record['id']))
+    
+    def _buttons_from_records(self, records: List[Dict[str, Any]]) -> Tuple[List[ButtonInternal], List[Button]]:
+        """Build button models from in-page extraction records
+        
+        Records are produced by our own script with fixed field types, so the
+        agent-facing models are constructed without Pydantic validation.
+        """
         buttons_internal = []
         buttons_external = []
         
-        selectors = [
-            'button',
-            '[role="button"]',
-            'input[type="submit"]',
-            'input[type="button"]'
-        ]
-        
-        for selector in selectors:
-            elements = await self.page.query_selector_all(selector)
+        for record in records:
+            text = record['text']
+            position = (record['x'], record['y'])
+            parent_text = record['parent_text']
+            
+            locator = self._element_locator(record)
+            
+            buttons_internal.append(ButtonInternal(
+                element_id=record['id'],
+                element=locator,
+                text=text,
+                position=position,
+                parent_text=parent_text
+            ))
             
-            for idx, element in enumerate(elements):
-                try:
-                    is_visible = await element.is_visible()
-                    if not is_visible:
-                        continue
-                    
-                    text = await element.text_content()
-                    if not text:
-                        text = await element.get_attribute('value') or ''
-                    text = text.strip()[:100]
-                    
-                    box = await element.bounding_box()
-                    if not box:
-                        continue
-                    position = (box['x'] + box['width'] / 2, box['y'] + box['height'] / 2)
-                    
-                    parent_text = await self._get_parent_text(element)
-                    
-                    element_id = self._generate_element_id()
-                    
-                    # Create locator for element
-                    locator = self.page.locator(f"{selector}").nth(idx)
-                    
-                    buttons_internal.append(ButtonInternal(
-                        element_id=element_id,
-                        element=locator,
-                        text=text,
-                        position=position,
-                        parent_text=parent_text
-                    ))
-                    
-                    buttons_external.append(Button(
-                        id=element_id,
-                        text=text,
-                        position=position,
-                        parent_text=parent_text
-                    ))
-                    
-                except Exception:
-                    continue
+            buttons_external.append(Button.model_construct(
+                id=record['id'],
+                text=text,
+                position=position,
+                parent_text=parent_text
+            ))
         
         return buttons_internal, buttons_external
     
     async def extract_links(self) -> List[Link]:
-        """Extract links (information for agent only, no Playwright elements needed)"""
-        links = []
-        elements = await self.page.query_selector_all('a[href]')
-        
-        for element in elements:
-            try:
-                is_visible = await element.is_visible()
-                if not is_visible:
-                    continue
-                
-                text = await element.text_content()
-                if not text:
-                    text = await element.get_attribute('aria-label') or ''
-                text = text.strip()[:100]
-                
-                href = await element.get_attribute('href')
-                if not href:
-                    continue
-                
-                # Make absolute URL
-                try:
-                    url = await self.page.evaluate(
-                        "(href) => new URL(href, window.location.href).href",
-                        href
-                    )
-                except Exception:
-                    url = href
-                
-                parent_text = await self._get_parent_text(element)
-                
-                links.append(Link(
-                    text=text,
-                    url=url,
-                    parent_text=parent_text
-                ))
-                
-            except Exception:
-                continue
+        """Extract links (information for agent only, no Playwright elements needed)
         
-        return links
+        URLs are resolved, filtered and deduplicated inside the page by one script.
+        """
+        records = await self.page.evaluate(EXTRACT_LINKS_SCRIPT)
+        
+        return [
+            Link.model_construct(
+                text=record['text'],
+                url=record['url'],
+                parent_text=record['parent_text']
+            )
+            for record in records
+        ]
     
     async def extract_inputs(self) -> Tuple[List[InputInternal], List[Input]]:
         """Extract input fields: internal (with Playwright elements) and external (for agent)"""
+        result = await self.page.evaluate(EXTRACT_INPUTS_SCRIPT, INPUT_SELECTORS)
+        self.duplicates_dropped += result['duplicates']
+        return self._inputs_from_records(result['records'])
+    
+    def _inputs_from_records(self, records: List[Dict[str, Any]]) -> Tuple[List[InputInternal], List[Input]]:
+        """Build input models from in-page extraction records"""
         inputs_internal = []
         inputs_external = []
         
-        selectors = [
-            'input[type="text"]',
-            'input[type="email"]',
-            'input[type="password"]',
-            'input[type="search"]',
-            'input[type="tel"]',
-            'input[type="url"]',
-            'input:not([type])',
-            'textarea'
-        ]
-        
-        for selector in selectors:
-            elements = await self.page.query_selector_all(selector)
+        for record in records:
+            position = (record['x'], record['y'])
+            
+            locator = self._element_locator(record)
+            
+            inputs_internal.append(InputInternal(
+                element_id=record['id'],
+                element=locator,
+                input_type=record['input_type'],
+                name=record['name'],
+                placeholder=record['placeholder'],
+                position=position,
+                parent_text=record['parent_text']
+            ))
             
-            for idx, element in enumerate(elements):
-                try:
-                    is_visible = await element.is_visible()
-                    if not is_visible:
-                        continue
-                    
-                    input_type = await element.get_attribute('type') or 'text'
-                    if selector == 'textarea':
-                        input_type = 'textarea'
-                    
-                    name = await element.get_attribute('name') or ''
-                    placeholder = await element.get_attribute('placeholder') or ''
-                    
-                    box = await element.bounding_box()
-                    if not box:
-                        continue
-                    position = (box['x'] + box['width'] / 2, box['y'] + box['height'] / 2)
-                    
-                    parent_text = await self._get_parent_text(element)
-                    
-                    element_id = self._generate_element_id()
-                    
-                    locator = self.page.locator(f"{selector}").nth(idx)
-                    
-                    inputs_internal.append(InputInternal(
-                        element_id=element_id,
-                        element=locator,
-                        input_type=input_type,
-                        name=name,
-                        placeholder=placeholder,
-                        position=position,
-                        parent_text=parent_text
-                    ))
-                    
-                    inputs_external.append(Input(
-                        id=element_id,
-                        input_type=input_type,
-                        name=name,
-                        placeholder=placeholder,
-                        position=position,
-                        parent_text=parent_text
-                    ))
-                    
-                except Exception:
-                    continue
+            inputs_external.append(Input.model_construct(
+                id=record['id'],
+                input_type=record['input_type'],
+                name=record['name'],
+                placeholder=record['placeholder'],
+                position=position,
+                parent_text=record['parent_text']
+            ))
         
         return inputs_internal, inputs_external
     
-    async def _get_parent_text(self, element: Locator) -> Optional[str]:
-        """Get text content from parent container(s)"""
-        try:
-            parent = await element.evaluate_handle("el => el.parentElement")
-            if parent:
-                text = await parent.evaluate("el => el.textContent")
-                return text.strip()[:200] if text else None
-        except Exception:
-            pass
-        return None
-    
-    # Helper methods for pagination
-    
-    def _get_max_y_coordinate(self, buttons: List[Button], inputs: List[Input]) -> float:
-        """Get maximum Y coordinate from buttons and inputs"""
-        max_y = 0.0
+    async def extract_accessible_elements(
+        self
+    ) -> Tuple[List[ButtonInternal], List[Button], List[InputInternal], List[Input]]:
+        """Extract buttons and inputs from Chromium accessibility tree
         
-        for btn in buttons:
-            if btn.position[1] > max_y:
-                max_y = btn.position[1]
+        Covers every element with an interactive role (comboboxes, checkboxes,
+        links, tabs...) and clickable elements without one, using two CDP calls
+        for the whole page. Elements are reported as compact role/name records.
         
-        for inp in inputs:
-            if inp.position[1] > max_y:
-                max_y = inp.position[1]
+        Returns:
+            Tuple of (buttons_internal, buttons_external, inputs_internal, inputs_external)
+        """
+        session = await self.cdp_session()
+        ax_tree = await session.send("Accessibility.getFullAXTree")
+        document = await capture_dom_snapshot(session)
         
-        return max_y
-    
-    def _filter_buttons_by_y_range(
-        self,
-        buttons_internal: List[ButtonInternal],
-        buttons_external: List[Button],
-        y_start: float,
-        y_end: float
-    ) -> Tuple[List[ButtonInternal], List[Button]]:
-        """Filter buttons by Y-coordinate range"""
-        buttons_int_filtered = [
-            btn for btn in buttons_internal
-            if y_start <= btn.position[1] < y_end
-        ]
+        buttons_internal = []
+        buttons_external = []
+        inputs_internal = []
+        inputs_external = []
         
-        buttons_ext_filtered = [
-            btn for btn in buttons_external
-            if y_start <= btn.position[1] < y_end
-        ]
+        elements = collect_accessible_elements(ax_tree['nodes'], document)
+        element_ids = await self.stamp_elements([(element.selector, 0) for element in elements])
+        
+        for element, element_id in zip(elements, element_ids):
+            if element_id is None:
+                continue
+            locator = self.page.locator(element_selector(element_id))
+            
+            if element.is_input:
+                attrs = document.attrs(element.node)
+                input_type = attrs.get('type') or element.role
+                placeholder = attrs.get('placeholder', '')
+                
+                inputs_internal.append(InputInternal(
+                    element_id=element_id,
+                    element=locator,
+                    input_type=input_type,
+                    name=element.name,
+                    placeholder=placeholder,
+                    position=element.position
+                ))
+                
+                inputs_external.append(Input.model_construct(
+                    id=element_id,
+                    input_type=input_type,
+                    name=element.name,
+                    placeholder=placeholder,
+                    position=element.position,
+                    role=element.role
+                ))
+            else:
+                buttons_internal.append(ButtonInternal(
+                    element_id=element_id,
+                    element=locator,
+                    text=element.name,
+                    position=element.position
+                ))
+                
+                buttons_external.append(Button.model_construct(
+                    id=element_id,
+                    text=element.name,
+                    position=element.position,
+                    role=element.role
+                ))
         
-        return buttons_int_filtered, buttons_ext_filtered
+        return buttons_internal, buttons_external, inputs_internal, inputs_external
     
-    def _filter_inputs_by_y_range(
-        self,
-        inputs_internal: List[InputInternal],
-        inputs_external: List[Input],
-        y_start: float,
-        y_end: float
-    ) -> Tuple[List[InputInternal], List[Input]]:
-        """Filter inputs by Y-coordinate range"""
-        inputs_int_filtered = [
-            inp for inp in inputs_internal
-            if y_start <= inp.position[1] < y_end
-        ]
+    async def _gather_limited(self, *awaitables: Awaitable[Any]) -> List[Any]:
+        """Run independent extractions concurrently, at most config.parse_concurrency at a time"""
+        semaphore = asyncio.Semaphore(config.parse_concurrency)
         
-        inputs_ext_filtered = [
-            inp for inp in inputs_external
-            if y_start <= inp.position[1] < y_end
-        ]
+        async def run(awaitable: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await awaitable
         
-        return inputs_int_filtered, inputs_ext_filtered
+        return await asyncio.gather(*(run(awaitable) for awaitable in awaitables))
     
     # Pagination methods
     
-    async def parse_page_text_items(self) -> List[PageTextItem]:
-        """Parse page text and split into chunks"""
-        from config import config
-        
-        url = self.page.url
-        title = await self.page.title()
-        full_text = await self.get_visible_text()
+    async def read_dom_state(self, reset: bool = False) -> Dict[str, Any]:
+        """Read DOM-change state tracked by the in-page MutationObserver
         
-        chunk_size = config.text_chunk_size
-        items = []
-        
-        for i in range(0, len(full_text), chunk_size):
-            text_chunk = full_text[i:i + chunk_size]
-            items.append(PageTextItem(
-                item_id=len(items),
-                total_items=-1,
-                url=url,
-                title=title,
-                text_chunk=text_chunk
-            ))
+        Args:
+            reset: Forget dirty regions and registered elements (before a full parse)
+            
+        Returns:
+            Dict with document_id and generation
+        """
+        return await self.page.evaluate(DOM_STATE_SCRIPT, reset)
+    
+    async def scroll_for_more(self, generation: int) -> Dict[str, Any]:
+        """Scroll one viewport down and wait until the page adds content and settles
         
-        if not items:
-            items = [PageTextItem(
-                item_id=0,
-                total_items=1,
-                url=url,
-                title=title,
-                text_chunk=""
-            )]
+        Args:
+            generation: DOM-change generation of the current snapshot
+            
+        Returns:
+            Dict with scrolled (window moved), changed (DOM changed after
+            `generation`) and the current generation
+        """
+        return await self.page.evaluate(SCROLL_FOR_MORE_SCRIPT, {
+            'generation': generation,
+            'timeout_ms': config.scroll_wait_timeout,
+            'quiet_ms': config.scroll_quiet_time
+        })
+    
+    async def parse_snapshot(self, version: int) -> PageSnapshot:
+        """Parse the page once and build text, buttons and links items from the same pass
         
-        # Update total_items
-        total = len(items)
-        items = [
-            PageTextItem(
-                item_id=item.item_id,
-                total_items=total,
-                url=item.url,
-                title=item.title,
-                text_chunk=item.text_chunk
+        Args:
+            version: Sequential number of this snapshot
+            
+        Returns:
+            PageSnapshot shared by all page information tools
+        """
+        self.duplicates_dropped = 0
+        url = self.page.url
+        dom_state = await self.read_dom_state(reset=True)
+        
+        # Extractions are independent: wall-clock time is set by the slowest one
+        if config.interactive_source == InteractiveSource.ACCESSIBILITY:
+            title, full_text, all_links, elements = await self._gather_limited(
+                self.page.title(),
+                self.get_visible_text(),
+                self.extract_links(),
+                self.extract_accessible_elements()
             )
-            for item in items
-        ]
-        
-        return items
+            buttons_internal, buttons_external, inputs_internal, inputs_external = elements
+        else:
+            title, full_text, all_links, buttons, inputs = await self._gather_limited(
+                self.page.title(),
+                self.get_visible_text(),
+                self.extract_links(),
+                self.extract_buttons(),
+                self.extract_inputs()
+            )
+            buttons_internal, buttons_external = buttons
+            inputs_internal, inputs_external = inputs
+        
+        return self._build_snapshot(
+            version, url, dom_state, title, full_text,
+            buttons_internal, buttons_external,
+            inputs_internal, inputs_external,
+            all_links
+        )
     
-    async def parse_page_buttons_items(self) -> Tuple[List[ButtonInternal], List[InputInternal], List[PageButtonsItem]]:
-        """Parse buttons and inputs, split by Y-coordinate ranges
+    async def patch_snapshot(self, snapshot: PageSnapshot, version: int) -> Optional[PageSnapshot]:
+        """Build new snapshot re-extracting buttons and inputs only inside changed DOM subtrees
         
+        Elements outside the changed subtrees keep their IDs and extracted data.
+        Text and links are re-read as a whole.
+        
+        Args:
+            snapshot: Snapshot of the same document to patch
+            version: Sequential number of the new snapshot
+            
         Returns:
-            Tuple of (all_buttons_internal, all_inputs_internal, buttons_items_for_agent)
+            Patched PageSnapshot, or None if the change is too broad and a full parse is needed
         """
-        from config import config
+        if config.interactive_source == InteractiveSource.ACCESSIBILITY:
+            return None
+        
+        result = await self.page.evaluate(PATCH_ELEMENTS_SCRIPT, {
+            'button_selectors': BUTTON_SELECTORS,
+            'input_selectors': INPUT_SELECTORS,
+            'max_dirty_roots': config.patch_max_dirty_roots
+        })
+        if result is None or result['document_id'] != snapshot.document_id:
+            return None
+        
+        self.duplicates_dropped = result['duplicates']
+        invalidated = set(result['invalidated'])
+        positions = {element_id: (x, y) for element_id, x, y in result['positions']}
+        
+        # Kept elements are reused with current positions, re-extracted ones replace them, in full-parse order
+        buttons_internal, buttons_external = self._merge_elements(
+            snapshot.buttons_internal, snapshot.buttons, invalidated,
+            *self._buttons_from_records(result['buttons']),
+            result['button_order'], positions
+        )
+        inputs_internal, inputs_external = self._merge_elements(
+            snapshot.inputs_internal, snapshot.inputs, invalidated,
+            *self._inputs_from_records(result['inputs']),
+            result['input_order'], positions
+        )
         
         url = self.page.url
-        title = await self.page.title()
-        
-        # Extract all elements
-        buttons_internal, buttons_external = await self.extract_buttons()
-        inputs_internal, inputs_external = await self.extract_inputs()
-        
-        # Determine max_y
-        max_y = self._get_max_y_coordinate(buttons_external, inputs_external)
+        title, full_text, all_links = await self._gather_limited(
+            self.page.title(),
+            self.get_visible_text(),
+            self.extract_links()
+        )
+        
+        dom_state = {'document_id': result['document_id'], 'generation': result['generation']}
+        
+        return self._build_snapshot(
+            version, url, dom_state, title, full_text,
+            buttons_internal, buttons_external,
+            inputs_internal, inputs_external,
+            all_links
+        )
+    
+    def _merge_elements(
+        self,
+        kept_internal: Dict[int, InternalElement],
+        kept_external: List[Element],
+        invalidated: Set[int],
+        new_internal: List[InternalElement],
+        new_external: List[Element],
+        order: List[int],
+        positions: Dict[int, Tuple[float, float]]
+    ) -> Tuple[List[InternalElement], List[Element]]:
+        """Combine elements outside changed subtrees with re-extracted ones
+        
+        Args:
+            kept_internal: Internal elements of the patched snapshot by ID
+            kept_external: Agent-facing elements of the patched snapshot
+            invalidated: IDs of elements inside changed subtrees
+            new_internal: Re-extracted internal elements
+            new_external: Re-extracted agent-facing elements
+            order: In-page ID order; elements no longer matched are dropped
+            positions: Current positions of registered elements by ID
+            
+        Returns:
+            Tuple of (internal elements, agent-facing elements) in ID order
+        """
+        internal = {element_id: element for element_id, element in kept_internal.items() if element_id not in invalidated}
+        external = {element.id: element for element in kept_external if element.id not in invalidated}
         
-        if max_y == 0:
-            max_y = await self.page.evaluate("() => document.body.scrollHeight")
+        # Layout shifted by changes elsewhere: kept elements take their current positions
+        for element_id, element in external.items():
+            position = positions.get(element_id)
+            if position is not None and position != element.position and element_id in internal:
+                internal[element_id].position = position
+                external[element_id] = element.model_copy(update={'position': position})
         
-        section_height = config.parse_item_size
+        internal.update((element.id, element) for element in new_internal)
+        external.update((element.id, element) for element in new_external)
         
-        items = []
-        y_start = 0.0
+        element_ids = [element_id for element_id in order if element_id in internal and element_id in external]
+        return [internal[element_id] for element_id in element_ids], [external[element_id] for element_id in element_ids]
+    
+    def _build_snapshot(
+        self,
+        version: int,
+        url: str,
+        dom_state: Dict[str, Any],
+        title: str,
+        full_text: str,
+        buttons_internal: List[ButtonInternal],
+        buttons_external: List[Button],
+        inputs_internal: List[InputInternal],
+        inputs_external: List[Input],
+        all_links: List[Link]
+    ) -> PageSnapshot:
+        """Split extracted data into paginated items and wrap it into PageSnapshot
         
-        while y_start < max_y:
-            y_end = y_start + section_height
-            
-            _, buttons_ext_filtered = self._filter_buttons_by_y_range(
-                buttons_internal, buttons_external,
-                y_start, y_end
-            )
-            
-            _, inputs_ext_filtered = self._filter_inputs_by_y_range(
-                inputs_internal, inputs_external,
-                y_start, y_end
-            )
-            
-            items.append(PageButtonsItem(
-                item_id=len(items),
-                total_items=-1,
-                url=url,
-                title=title,
-                buttons=buttons_ext_filtered,
-                inputs=inputs_ext_filtered
-            ))
-            
-            y_start = y_end
+        Buttons items are not built here: the snapshot sections its Y-sorted
+        element index lazily, when the agent asks for them.
+        """
+        # A node matched by both button and input selectors is reported as an input
+        input_ids = {inp.id for inp in inputs_external}
+        if any(btn.id in input_ids for btn in buttons_external):
+            kept_count = len(buttons_external)
+            buttons_internal = [btn for btn in buttons_internal if btn.id not in input_ids]
+            buttons_external = [btn for btn in buttons_external if btn.id not in input_ids]
+            self.duplicates_dropped += kept_count - len(buttons_external)
+        
+        # Collapse headers, menus and footers already read on other pages of the site
+        page_text = full_text
+        collapsed_text: List[str] = []
+        page_links = all_links
+        repeated_links_omitted = None
+        if self.boilerplate:
+            page_text, collapsed_text = self.boilerplate.collapse_text(url, full_text)
+            page_links, repeated_links_omitted = self.boilerplate.collapse_links(url, all_links)
+        
+        return PageSnapshot(
+            version=version,
+            url=url,
+            document_id=dom_state['document_id'],
+            generation=dom_state['generation'],
+            title=title,
+            text_items=self._split_text_items(url, title, page_text),
+            links_items=self._split_links_items(url, title, page_links, repeated_links_omitted or None),
+            links=all_links,
+            collapsed_text_chunks=[chunk for text in collapsed_text for chunk in self.text_chunker.split(text)],
+            buttons_internal=buttons_internal,
+            buttons=buttons_external,
+            inputs_internal=inputs_internal,
+            inputs=inputs_external,
+            section_height=config.parse_item_size,
+            duplicates_dropped=self.duplicates_dropped
+        )
+    
+    def _split_text_items(self, url: str, title: str, full_text: str) -> List[PageTextItem]:
+        """Split page text into token-budgeted chunks on paragraph and sentence boundaries"""
+        chunks = self.text_chunker.split(full_text) or [""]
         
-        if not items:
-            items = [PageButtonsItem(
-                item_id=0,
-                total_items=1,
+        return [
+            PageTextItem(
+                item_id=i,
+                total_items=len(chunks),
                 url=url,
                 title=title,
-                buttons=[],
-                inputs=[]
-            )]
-        
-        # Update total_items
-        total = len(items)
-        items = [
-            PageButtonsItem(
-                item_id=item.item_id,
-                total_items=total,
-                url=item.url,
-                title=item.title,
-                buttons=item.buttons,
-                inputs=item.inputs
+                text_chunk=text_chunk
             )
-            for item in items
+            for i, text_chunk in enumerate(chunks)
         ]
-        
-        return buttons_internal, inputs_internal, items
     
-    async def parse_page_links_items(self) -> List[PageLinksItem]:
-        """Parse links and split into chunks by count
-        
-        Returns:
-            List of PageLinksItem for agent
-        """
-        from config import config
-        
-        url = self.page.url
-        title = await self.page.title()
-        
-        all_links = await self.extract_links()
-        
+    def _split_links_items(
+        self,
+        url: str,
+        title: str,
+        all_links: List[Link],
+        repeated_links_omitted: Optional[int] = None
+    ) -> List[PageLinksItem]:
+        """Split links into chunks by count"""
         chunk_size = config.links_chunk_size
-        items = []
-        
-        for i in range(0, len(all_links), chunk_size):
-            links_chunk = all_links[i:i + chunk_size]
-            items.append(PageLinksItem(
-                item_id=len(items),
-                total_items=-1,
-                url=url,
-                title=title,
-                links=links_chunk
-            ))
+        chunks = [all_links[i:i + chunk_size] for i in range(0, len(all_links), chunk_size)] or [[]]
         
-        if not items:
-            items = [PageLinksItem(
-                item_id=0,
-                total_items=1,
+        return [
+            PageLinksItem(
+                item_id=i,
+                total_items=len(chunks),
                 url=url,
                 title=title,
-                links=[]
-            )]
-        
-        # Update total_items
-        total = len(items)
-        items = [
-            PageLinksItem(
-                item_id=item.item_id,
-                total_items=total,
-                url=item.url,
-                title=item.title,
-                links=item.links
+                links=links_chunk,
+                repeated_links_omitted=repeated_links_omitted
             )
-            for item in items
+            for i, links_chunk in enumerate(chunks)
         ]
-        
-        return items
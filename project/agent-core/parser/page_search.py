@@ -0,0 +1,87 @@
+"""
+Full-text search over a page snapshot.
+Text chunks, buttons, inputs and links are indexed once into an inverted index
+and ranked with Okapi BM25, so the agent can find a phrase in one tool call
+instead of paging through the whole page.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+_TERM_PATTERN = re.compile(r'\w+')
+
+# BM25 parameters: term frequency saturation and document length normalization
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word terms (any script)"""
+    return _TERM_PATTERN.findall(text.lower())
+
+
+class SearchDocument:
+    """Indexed unit of a page: text chunk, button, input or link"""
+
+    def __init__(
+        self,
+        kind: str,
+        text: str,
+        item_id: Optional[int] = None,
+        element_id: Optional[int] = None,
+        url: Optional[str] = None,
+        context: Optional[str] = None
+    ):
+        self.kind = kind
+        self.text = text
+        self.item_id = item_id
+        self.element_id = element_id
+        self.url = url
+        self.context = context
+
+
+class PageSearchIndex:
+    """Inverted index with BM25 ranking over search documents"""
+
+    def __init__(self, documents: List[SearchDocument]):
+        self.documents = documents
+        self._postings: Dict[str, List[Tuple[int, int]]] = {}
+        self._lengths: List[int] = []
+
+        for doc_index, document in enumerate(documents):
+            terms = tokenize(' '.join(filter(None, [document.text, document.context, document.url])))
+            self._lengths.append(len(terms))
+            for term, frequency in Counter(terms).items():
+                self._postings.setdefault(term, []).append((doc_index, frequency))
+
+        self._average_length = sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+
+    def search(self, query: str, top_k: int) -> List[Tuple[SearchDocument, float]]:
+        """Rank documents against query
+
+        Args:
+            query: Free-text query
+            top_k: Maximum number of results
+
+        Returns:
+            (document, score) pairs with positive score, best first
+        """
+        scores: Dict[int, float] = {}
+        total = len(self.documents)
+
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_index, frequency in postings:
+                length_ratio = self._lengths[doc_index] / self._average_length
+                weight = frequency * (BM25_K1 + 1) / (
+                    frequency + BM25_K1 * (1 - BM25_B + BM25_B * length_ratio)
+                )
+                scores[doc_index] = scores.get(doc_index, 0.0) + idf * weight
+
+        ranked = sorted(scores.items(), key=lambda pair: (-pair[1], pair[0]))[:top_k]
+        return [(self.documents[doc_index], score) for doc_index, score in ranked]
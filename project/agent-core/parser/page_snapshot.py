@@ -0,0 +1,177 @@
+from bisect import bisect_left
+from itertools import chain
+from typing import Any, Dict, List, Optional, Set
+
+from models.button import Button, ButtonInternal
+from models.input_field import Input, InputInternal
+from models.link import Link
+from models.page import PageTextItem, PageButtonsItem, PageLinksItem, PageSearchItem, SearchHit
+from .page_search import PageSearchIndex, SearchDocument
+from .spatial_index import YRangeIndex, merge_sections, section_bounds, section_of
+
+
+class PageSnapshot:
+    """Result of a single page parse shared by the text, buttons and links paginators.
+
+    A snapshot is keyed by page URL, document and DOM-change generation
+    tracked by the in-page MutationObserver: it stays valid until the page
+    navigates or its DOM changes. `version` grows with every parse or patch
+    and identifies the snapshot in logs.
+
+    Buttons items cover `section_height` bands of the page that contain at
+    least one element and are materialized on first request.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        url: str,
+        document_id: str,
+        generation: int,
+        title: str,
+        text_items: List[PageTextItem],
+        links_items: List[PageLinksItem],
+        links: List[Link],
+        buttons_internal: List[ButtonInternal],
+        buttons: List[Button],
+        inputs_internal: List[InputInternal],
+        inputs: List[Input],
+        section_height: float,
+        duplicates_dropped: int = 0,
+        collapsed_text_chunks: Optional[List[str]] = None
+    ):
+        self.version = version
+        self.url = url
+        self.document_id = document_id
+        self.generation = generation
+        self.title = title
+        self.duplicates_dropped = duplicates_dropped  # Repeated node matches removed by the parser
+        self.text_items = text_items
+        self.links_items = links_items
+        self.links = links  # All page links, including ones collapsed as boilerplate
+        # Text replaced by boilerplate markers in text_items, still searchable
+        self.collapsed_text_chunks = collapsed_text_chunks or []
+
+        # Flat element lists kept for incremental patching
+        self.buttons = buttons
+        self.inputs = inputs
+
+        # Y-sorted element indexes and non-empty sections for buttons items
+        self.section_height = section_height
+        self._buttons_index = YRangeIndex(buttons)
+        self._inputs_index = YRangeIndex(inputs)
+        self._sections = merge_sections(
+            self._buttons_index.sections(section_height),
+            self._inputs_index.sections(section_height)
+        )
+        self._buttons_items: Dict[int, PageButtonsItem] = {}
+
+        # Playwright element storage
+        self.buttons_internal: Dict[int, ButtonInternal] = {btn.id: btn for btn in buttons_internal}
+        self.inputs_internal: Dict[int, InputInternal] = {inp.id: inp for inp in inputs_internal}
+
+        # Full-text index, built on first search
+        self._search_index: Optional[PageSearchIndex] = None
+
+    def is_valid_for(self, url: str, dom_state: Dict[str, Any]) -> bool:
+        """Check whether snapshot still describes the page at given URL and DOM state"""
+        return self.is_same_document(url, dom_state) and self.generation == dom_state['generation']
+
+    def is_same_document(self, url: str, dom_state: Dict[str, Any]) -> bool:
+        """Check whether snapshot was taken from the same document (so it can be patched)"""
+        return self.url == url and self.document_id == dom_state['document_id']
+
+    @property
+    def buttons_item_count(self) -> int:
+        """Number of buttons items (one empty item for a page without elements)"""
+        return max(len(self._sections), 1)
+
+    def get_buttons_item(self, item_id: int) -> PageButtonsItem:
+        """Get buttons and inputs of the item_id-th non-empty section"""
+        item = self._buttons_items.get(item_id)
+        if item is None:
+            buttons: List[Button] = []
+            inputs: List[Input] = []
+            if self._sections:
+                y_start, y_end = section_bounds(self._sections[item_id], self.section_height)
+                buttons = self._buttons_index.between(y_start, y_end)
+                inputs = self._inputs_index.between(y_start, y_end)
+            item = PageButtonsItem(
+                item_id=item_id,
+                total_items=self.buttons_item_count,
+                url=self.url,
+                title=self.title,
+                buttons=buttons,
+                inputs=inputs
+            )
+            self._buttons_items[item_id] = item
+        return item
+
+    def first_buttons_item_with(self, element_ids: Set[int]) -> Optional[int]:
+        """Index of the first buttons item containing one of the given buttons or inputs"""
+        ys = [
+            element.position[1]
+            for element in chain(self.buttons, self.inputs)
+            if element.id in element_ids
+        ]
+        if not ys:
+            return None
+        return bisect_left(self._sections, section_of(min(ys), self.section_height))
+
+    def first_links_item_with(self, urls: Set[str]) -> Optional[int]:
+        """Index of the first links item containing one of the given URLs"""
+        for index, item in enumerate(self.links_items):
+            if any(link.url in urls for link in item.links):
+                return index
+        return None
+
+    def get_button(self, button_id: int) -> Optional[ButtonInternal]:
+        """Get internal button object by ID"""
+        return self.buttons_internal.get(button_id)
+
+    def get_input(self, input_id: int) -> Optional[InputInternal]:
+        """Get internal input object by ID"""
+        return self.inputs_internal.get(input_id)
+
+    @property
+    def search_index(self) -> PageSearchIndex:
+        """Inverted index over text chunks, buttons, inputs and links of this snapshot"""
+        if self._search_index is None:
+            documents = [
+                SearchDocument('text', item.text_chunk, item_id=item.item_id)
+                for item in self.text_items
+            ]
+            # Collapsed boilerplate has no text item to page to: the hit carries the text itself
+            documents.extend(SearchDocument('text', chunk) for chunk in self.collapsed_text_chunks)
+            documents.extend(
+                SearchDocument('button', btn.text, element_id=btn.id, context=btn.parent_text)
+                for btn in self.buttons
+            )
+            documents.extend(
+                SearchDocument(
+                    'input', ' '.join(filter(None, [inp.name, inp.placeholder])),
+                    element_id=inp.id, context=inp.parent_text
+                )
+                for inp in self.inputs
+            )
+            documents.extend(
+                SearchDocument('link', link.text, url=link.url, context=link.parent_text)
+                for link in self.links
+            )
+            self._search_index = PageSearchIndex(documents)
+        return self._search_index
+
+    def search(self, query: str, top_k: int) -> PageSearchItem:
+        """Find text chunks and elements best matching query"""
+        hits = [
+            SearchHit(
+                kind=document.kind,
+                score=round(score, 2),
+                text=document.text,
+                item_id=document.item_id,
+                id=document.element_id,
+                url=document.url
+            )
+            for document, score in self.search_index.search(query, top_k)
+        ]
+        return PageSearchItem(url=self.url, title=self.title, query=query, hits=hits)
@@ -0,0 +1,108 @@
+"""
+Page readiness detection after navigation and actions.
+A page is ready once its DOM has not changed and no document, XHR or fetch
+request has started or finished for a short quiet window. Images, beacons and
+other subresources are ignored, and requests open longer than a limit
+(long-polling, streaming) are not waited for, so background traffic does not
+hold every step until the timeout as `networkidle` does.
+"""
+
+import asyncio
+import time
+from typing import Dict
+
+from playwright.async_api import Page, Request, Error as PlaywrightError
+
+from config import config
+from .scripts import WAIT_FOR_QUIET_DOM_SCRIPT
+
+# Requests that load or change page content
+TRACKED_RESOURCE_TYPES = {'document', 'xhr', 'fetch'}
+
+# Pause between network checks while a request is in flight, in seconds
+_NETWORK_POLL_INTERVAL = 0.05
+
+
+class PageReadiness:
+    """Tracks in-flight requests of a page and waits for DOM and network quiet"""
+
+    def __init__(self, page: Page):
+        self._page = page
+        self._pending: Dict[Request, float] = {}  # Request -> start time
+        self._last_network_activity = time.monotonic()
+
+        page.on('request', self._on_request)
+        page.on('requestfinished', self._on_request_done)
+        page.on('requestfailed', self._on_request_done)
+
+    def detach(self) -> None:
+        """Stop tracking requests of the page"""
+        self._page.remove_listener('request', self._on_request)
+        self._page.remove_listener('requestfinished', self._on_request_done)
+        self._page.remove_listener('requestfailed', self._on_request_done)
+        self._pending.clear()
+
+    def start_navigation(self) -> None:
+        """Drop requests of the previous document; they no longer delay readiness"""
+        self._pending.clear()
+        self._last_network_activity = time.monotonic()
+
+    def _on_request(self, request: Request) -> None:
+        if request.resource_type in TRACKED_RESOURCE_TYPES:
+            self._last_network_activity = time.monotonic()
+            self._pending[request] = self._last_network_activity
+
+    def _on_request_done(self, request: Request) -> None:
+        if self._pending.pop(request, None) is not None:
+            self._last_network_activity = time.monotonic()
+
+    def _network_quiet_for(self, now: float) -> float:
+        """Seconds without tracked network activity; 0 while a short-lived request is in flight"""
+        long_request = config.readiness_long_request_ms / 1000
+        if any(now - started < long_request for started in self._pending.values()):
+            return 0.0
+        return now - self._last_network_activity
+
+    async def wait(self, timeout_ms: int) -> int:
+        """Wait until DOM and network have been quiet for config.readiness_quiet_ms
+
+        Args:
+            timeout_ms: Upper bound of the wait
+
+        Returns:
+            Milliseconds actually waited
+        """
+        started = time.monotonic()
+        deadline = started + timeout_ms / 1000
+        quiet = config.readiness_quiet_ms / 1000
+
+        while True:
+            now = time.monotonic()
+            remaining = deadline - now
+            if remaining <= 0 or self._page.is_closed():
+                break
+
+            network_quiet = self._network_quiet_for(now)
+            if network_quiet < quiet:
+                pause = quiet - network_quiet if network_quiet else _NETWORK_POLL_INTERVAL
+                await asyncio.sleep(min(pause, remaining))
+                continue
+
+            try:
+                dom = await self._page.evaluate(WAIT_FOR_QUIET_DOM_SCRIPT, {
+                    'quiet_ms': config.readiness_quiet_ms,
+                    'timeout_ms': remaining * 1000
+                })
+            except PlaywrightError:
+                # Execution context replaced by a navigation: wait for the new document
+                try:
+                    await self._page.wait_for_load_state('domcontentloaded', timeout=remaining * 1000)
+                except PlaywrightError:
+                    pass
+                continue
+
+            # The network may have woken up while the DOM was settling
+            if dom['quiet'] and self._network_quiet_for(time.monotonic()) >= quiet:
+                break
+
+        return round((time.monotonic() - started) * 1000)
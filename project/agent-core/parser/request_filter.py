@@ -0,0 +1,158 @@
+"""
+Network request blocking for a browser page.
+Images, fonts, media and tracker scripts do not change the DOM text, buttons
+or links the agent reads, so they are aborted before download.
+
+Blocking uses the DevTools Fetch domain rather than Playwright routing:
+any `context.route()` makes Playwright turn off the HTTP cache, which would
+throw away the warm cache of a persistent profile. Only requests matching the
+blocked resource types or domains are paused and decided in Python.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set
+from urllib.parse import urlsplit
+
+from loguru import logger
+from playwright.async_api import BrowserContext, CDPSession, Page, Error as PlaywrightError
+
+from config import config
+from .handle_tracker import HandleTracker
+
+# Playwright resource type names -> DevTools Network.ResourceType
+_CDP_RESOURCE_TYPES: Dict[str, str] = {
+    'document': 'Document',
+    'stylesheet': 'Stylesheet',
+    'image': 'Image',
+    'media': 'Media',
+    'font': 'Font',
+    'script': 'Script',
+    'texttrack': 'TextTrack',
+    'xhr': 'XHR',
+    'fetch': 'Fetch',
+    'eventsource': 'EventSource',
+    'websocket': 'WebSocket',
+    'manifest': 'Manifest',
+    'ping': 'Ping',
+    'other': 'Other',
+}
+
+# Typical transfer size per resource type, in bytes (HTTP Archive medians, rounded).
+# A blocked request is never answered, so the saving can only be estimated.
+ESTIMATED_RESOURCE_BYTES: Dict[str, int] = {
+    'image': 40_000,
+    'media': 500_000,
+    'font': 35_000,
+    'stylesheet': 15_000,
+    'script': 30_000,
+    'xhr': 5_000,
+    'fetch': 5_000,
+}
+_DEFAULT_RESOURCE_BYTES = 5_000
+
+
+def _matches_domain(host: str, domains: Set[str]) -> bool:
+    """Host equals one of the domains or is their subdomain"""
+    parts = host.split('.')
+    return any('.'.join(parts[i:]) in domains for i in range(len(parts)))
+
+
+class BlockedRequests:
+    """Requests aborted since the last reset"""
+
+    def __init__(self):
+        self.count = 0
+        self.estimated_bytes = 0
+        self.by_type: Dict[str, int] = {}
+
+    def record(self, resource_type: str) -> None:
+        self.count += 1
+        self.estimated_bytes += ESTIMATED_RESOURCE_BYTES.get(resource_type, _DEFAULT_RESOURCE_BYTES)
+        self.by_type[resource_type] = self.by_type.get(resource_type, 0) + 1
+
+    def __repr__(self) -> str:
+        types = ', '.join(f"{name}={count}" for name, count in sorted(self.by_type.items()))
+        return f"{self.count} requests, ~{self.estimated_bytes // 1024} KB estimated ({types})"
+
+
+class RequestFilter:
+    """Aborts requests by resource type and domain; allowed domains are never blocked"""
+
+    def __init__(
+        self,
+        blocked_resource_types: Iterable[str],
+        blocked_domains: Iterable[str],
+        allowed_domains: Iterable[str],
+        handles: Optional[HandleTracker] = None
+    ):
+        self.blocked_resource_types: Set[str] = set(blocked_resource_types)
+        self.blocked_domains: Set[str] = {domain.lower() for domain in blocked_domains}
+        self.allowed_domains: Set[str] = {domain.lower() for domain in allowed_domains}
+        self._session: Optional[CDPSession] = None
+        self._handles = handles or HandleTracker()  # Accounts for the CDP session
+
+        self.navigation = BlockedRequests()  # Since the last navigation started
+        self.total = BlockedRequests()       # Since the context was opened
+
+    @property
+    def enabled(self) -> bool:
+        return self._session is not None
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """Whether request is blocked by type or domain and not allowed by domain"""
+        if resource_type == 'document':
+            return False  # Pages and frames themselves are what the agent reads
+        host = (urlsplit(url).hostname or '').lower()
+        if _matches_domain(host, self.allowed_domains):
+            return False
+        return resource_type in self.blocked_resource_types or _matches_domain(host, self.blocked_domains)
+
+    def fetch_patterns(self) -> List[Dict[str, str]]:
+        """Fetch.enable patterns: requests that may be blocked, all others are never paused"""
+        patterns = [
+            {'urlPattern': '*', 'resourceType': _CDP_RESOURCE_TYPES.get(resource_type, resource_type.capitalize())}
+            for resource_type in sorted(self.blocked_resource_types)
+        ]
+        for domain in sorted(self.blocked_domains):
+            patterns.append({'urlPattern': f'*://{domain}/*'})
+            patterns.append({'urlPattern': f'*://*.{domain}/*'})
+        return patterns
+
+    async def enable(self, context: BrowserContext, page: Page) -> None:
+        """Start pausing and deciding blockable requests of the page and its same-process frames"""
+        if self._session is not None:
+            return
+        session = self._handles.track(await context.new_cdp_session(page))
+        session.on('Fetch.requestPaused', self._handle)
+        patterns = self.fetch_patterns()
+        if patterns:  # Without patterns Fetch would pause every request
+            await session.send('Fetch.enable', {'patterns': patterns})
+        self._session = session
+
+    async def disable(self) -> None:
+        """Stop pausing; requests go to the network untouched again"""
+        if self._session is None:
+            return
+        session, self._session = self._session, None
+        await self._handles.release(session)  # Detaching also disables Fetch interception
+
+    def start_navigation(self) -> None:
+        """Reset per-navigation counters"""
+        self.navigation = BlockedRequests()
+
+    async def _handle(self, event: Dict[str, Any]) -> None:
+        session = self._session
+        if session is None:
+            return
+        request_id = event['requestId']
+        resource_type = event.get('resourceType', 'Other').lower()
+        try:
+            if self.should_block(event['request']['url'], resource_type):
+                self.navigation.record(resource_type)
+                self.total.record(resource_type)
+                await session.send('Fetch.failRequest', {'requestId': request_id, 'errorReason': 'BlockedByClient'})
+            else:
+                await session.send('Fetch.continueRequest', {'requestId': request_id})
+        except PlaywrightError as e:
+            # Request cancelled by a navigation or the page closed meanwhile
+            if config.is_debug():
+                logger.debug(f"Paused request {request_id} not resolved: {e}")
@@ -0,0 +1,570 @@
+"""
+In-page JavaScript used by PageParser.
+Each script runs in a single page.evaluate call and returns plain JSON records,
+so extraction cost does not grow with Playwright round-trips per element.
+"""
+
+# Attribute stamped on every extracted element; its value is the element ID
+# reported to the agent and is resolved back with an attribute selector.
+ELEMENT_ID_ATTRIBUTE = 'data-agent-id'
+
+# Length limits of reported element text and parent context, in characters
+ELEMENT_TEXT_LIMIT = 100
+PARENT_TEXT_LIMIT = 200
+
+# Agent runtime installed once per document (as context init script and lazily
+# by every runtime call). It owns:
+#   - a MutationObserver that bumps `generation` and collects dirty subtree roots,
+#   - element ID stamping and a registry of extracted elements by ID,
+#   - extraction helpers shared by full and incremental parses.
+# Extraction walks the document together with its open shadow roots and
+# same-origin frames; elements inside frames are reported with `frame`, the IDs
+# of the frame elements leading to them from the top document.
+AGENT_RUNTIME_SCRIPT = """
+() => {
+    if (window.__chromeAgent) return window.__chromeAgent;
+
+    const ID_ATTRIBUTE = '__ELEMENT_ID_ATTRIBUTE__';
+    const TEXT_LIMIT = __ELEMENT_TEXT_LIMIT__;
+    const PARENT_TEXT_LIMIT = __PARENT_TEXT_LIMIT__;
+
+    const state = {
+        documentId: Math.random().toString(36).slice(2),
+        generation: 0,
+        growth: 0,  // Mutations that added elements; attribute and text changes do not count
+        lastChange: performance.now(),
+        dirty: new Set(),
+        registry: new Map(),
+        nextId: 0
+    };
+
+    // Parent across shadow root and same-origin frame boundaries
+    const composedParent = (node) => {
+        if (node.nodeType === Node.DOCUMENT_FRAGMENT_NODE) return node.host || null;
+        if (node.nodeType === Node.DOCUMENT_NODE) {
+            const view = node.defaultView;
+            return view && view !== window ? view.frameElement : null;
+        }
+        return node.parentNode;
+    };
+
+    const composedParentElement = (node) => {
+        let parent = composedParent(node);
+        while (parent && parent.nodeType !== Node.ELEMENT_NODE) parent = composedParent(parent);
+        return parent;
+    };
+
+    // Whether a composed ancestor of node (not node itself) is one of `nodes`
+    const hasAncestorIn = (node, nodes) => {
+        for (let parent = composedParent(node); parent; parent = composedParent(parent)) {
+            if (nodes.has(parent)) return true;
+        }
+        return false;
+    };
+
+    // Connected to the top document; a frame's old document is not, once it navigated
+    const isAttached = (el) => {
+        if (!el.isConnected) return false;
+        const owner = el.ownerDocument;
+        if (owner === document) return true;
+        const frame = owner.defaultView && owner.defaultView.frameElement;
+        return Boolean(frame) && frame.contentDocument === owner && isAttached(frame);
+    };
+
+    const markDirty = (node) => {
+        const element = node.nodeType === Node.ELEMENT_NODE ? node : composedParentElement(node);
+        if (element) state.dirty.add(element);
+    };
+
+    const observer = new MutationObserver((mutations) => {
+        let changed = false;
+        for (const mutation of mutations) {
+            // Our own ID stamps are not page changes
+            if (mutation.type === 'attributes' && mutation.attributeName === ID_ATTRIBUTE) continue;
+            changed = true;
+            if (mutation.type === 'childList') {
+                mutation.addedNodes.forEach((node) => {
+                    if (node.nodeType === Node.ELEMENT_NODE) state.growth += 1;
+                    markDirty(node.nodeType === Node.ELEMENT_NODE ? node : mutation.target);
+                });
+            } else {
+                markDirty(mutation.target);
+            }
+        }
+        if (changed) {
+            state.generation += 1;
+            state.lastChange = performance.now();
+        }
+    });
+
+    // Shadow roots and frame documents are observed from the first extraction that reaches them
+    const watched = new WeakSet();
+    const watch = (root) => {
+        if (watched.has(root)) return;
+        watched.add(root);
+        observer.observe(root, {subtree: true, childList: true, attributes: true, characterData: true});
+    };
+    watch(document);
+
+    // A frame navigation replaces its document: everything inside the frame changed
+    const watchFrame = (frame) => {
+        if (watched.has(frame)) return;
+        watched.add(frame);
+        frame.addEventListener('load', () => {
+            markDirty(frame);
+            state.growth += 1;
+            state.generation += 1;
+            state.lastChange = performance.now();
+        });
+    };
+
+    const isVisible = (el, rect) => {
+        if (rect.width === 0 || rect.height === 0) return false;
+        const style = (el.ownerDocument.defaultView || window).getComputedStyle(el);
+        return style.visibility !== 'hidden' && style.visibility !== 'collapse';
+    };
+
+    // textContent with whitespace runs collapsed, reading text nodes only until `limit` is reached
+    const normalizedText = (node, limit) => {
+        const walker = (node.ownerDocument || document).createTreeWalker(node, NodeFilter.SHOW_TEXT);
+        let text = '';
+        while (text.length <= limit && walker.nextNode()) {
+            let chunk = walker.currentNode.nodeValue.replace(/\\s+/g, ' ');
+            if (!text || text.endsWith(' ')) chunk = chunk.replace(/^ /, '');
+            text += chunk;
+        }
+        return text.trim().slice(0, limit);
+    };
+
+    const parentText = (el) => {
+        const parent = composedParentElement(el);
+        return parent ? normalizedText(parent, PARENT_TEXT_LIMIT) || null : null;
+    };
+
+    // Reuse the element's stamped ID unless another live element owns it (e.g. a cloned node)
+    const assignId = (el) => {
+        const stamped = el.getAttribute(ID_ATTRIBUTE);
+        let id = stamped === null ? NaN : Number(stamped);
+        const owner = state.registry.get(id);
+        if (!Number.isInteger(id) || (owner && owner !== el && isAttached(owner))) {
+            id = state.nextId++;
+            el.setAttribute(ID_ATTRIBUTE, String(id));
+        } else {
+            state.nextId = Math.max(state.nextId, id + 1);
+        }
+        state.registry.set(id, el);
+        return id;
+    };
+
+    const readButton = (el) => {
+        let text = normalizedText(el, TEXT_LIMIT);
+        if (!text) text = (el.getAttribute('value') || '').trim().slice(0, TEXT_LIMIT);
+        return {text: text};
+    };
+
+    const readInput = (el, selector) => ({
+        input_type: selector === 'textarea' ? 'textarea' : (el.getAttribute('type') || 'text'),
+        name: el.getAttribute('name') || '',
+        placeholder: el.getAttribute('placeholder') || ''
+    });
+
+    // Predicate: element inside one of the changed subtrees, or containing one (its text changed)
+    const overlapping = (roots) => {
+        const rootSet = new Set(roots);
+        const containers = new Set();
+        roots.forEach((root) => {
+            for (let node = root; node; node = composedParent(node)) containers.add(node);
+        });
+        return (el) => containers.has(el) || hasAncestorIn(el, rootSet);
+    };
+
+    // Trees searched by extraction as [{root, frame, dx, dy}]: the document, open
+    // shadow roots and documents of visible same-origin frames, each with the
+    // frame path and the offset of its frame viewport in the top document, so
+    // positions do not change when the page is scrolled.
+    const scopes = () => {
+        const trees = [];
+        const visit = (root, frame, dx, dy) => {
+            watch(root);
+            trees.push({root: root, frame: frame, dx: dx, dy: dy});
+            root.querySelectorAll('*').forEach((el) => {
+                if (el.shadowRoot) visit(el.shadowRoot, frame, dx, dy);
+                if (el.tagName !== 'IFRAME' && el.tagName !== 'FRAME') return;
+
+                let frameDocument = null;
+                try {
+                    frameDocument = el.contentDocument;  // null for cross-origin frames
+                } catch (e) {}
+                if (!frameDocument || !frameDocument.documentElement) return;
+
+                const rect = el.getBoundingClientRect();
+                if (!isVisible(el, rect)) return;
+                watchFrame(el);
+                visit(
+                    frameDocument, frame.concat([assignId(el)]),
+                    dx + rect.x + (el.clientLeft || 0), dy + rect.y + (el.clientTop || 0)
+                );
+            });
+        };
+        visit(document, [], window.scrollX, window.scrollY);
+        return trees;
+    };
+
+    // Visible elements matching selectors (passing `inScope` when given) as
+    // {records: [{id, frame, x, y, parent_text, ...fields}], duplicates}, in
+    // selector order, then tree and document order. A node matched by several
+    // selectors is reported once; `duplicates` counts the dropped repeats.
+    // `trees` from scopes() may be passed in to share one traversal.
+    const collect = (selectors, inScope, read, trees) => {
+        const records = [];
+        const seen = new Map();  // element -> reported
+        let duplicates = 0;
+        trees = trees || scopes();
+        selectors.forEach((selector) => trees.forEach((tree) => {
+            tree.root.querySelectorAll(selector).forEach((el) => {
+                if (inScope && !inScope(el)) return;
+                if (seen.has(el)) {
+                    if (seen.get(el)) duplicates += 1;
+                    return;
+                }
+
+                const rect = el.getBoundingClientRect();
+                const visible = isVisible(el, rect);
+                seen.set(el, visible);
+                if (!visible) return;
+
+                const record = read(el, selector);
+                record.id = assignId(el);
+                record.frame = tree.frame;
+                record.x = tree.dx + rect.x + rect.width / 2;
+                record.y = tree.dy + rect.y + rect.height / 2;
+                record.parent_text = parentText(el);
+                records.push(record);
+            });
+        }));
+        return {records: records, duplicates: duplicates};
+    };
+
+    // IDs of registered elements in the same order `collect` reports them; with
+    // `positions` given, also records [id, x, y] of each, as `collect` computes them
+    const order = (selectors, trees, positions) => {
+        const ids = new Set();
+        selectors.forEach((selector) => trees.forEach((tree) => {
+            tree.root.querySelectorAll(selector).forEach((el) => {
+                const id = Number(el.getAttribute(ID_ATTRIBUTE));
+                if (state.registry.get(id) !== el || ids.has(id)) return;
+                ids.add(id);
+                if (positions) {
+                    const rect = el.getBoundingClientRect();
+                    positions.push([id, tree.dx + rect.x + rect.width / 2, tree.dy + rect.y + rect.height / 2]);
+                }
+            });
+        }));
+        return Array.from(ids);
+    };
+
+    // Attached, non-overlapping dirty roots; null when the change is too broad to patch
+    const takeDirtyRoots = (limit) => {
+        const dirty = Array.from(state.dirty).filter(isAttached);
+        state.dirty.clear();
+        if (dirty.length > limit) return null;
+        if (dirty.some((el) => el === document.documentElement || el === document.body)) return null;
+        const dirtySet = new Set(dirty);
+        return dirty.filter((el) => !hasAncestorIn(el, dirtySet));
+    };
+
+    const runtime = {
+        takeState: (reset) => {
+            if (reset) {
+                state.dirty.clear();
+                state.registry.clear();
+            }
+            return {document_id: state.documentId, generation: state.generation};
+        },
+
+        extractButtons: (selectors) => collect(selectors, null, readButton),
+
+        extractInputs: (selectors) => collect(selectors, null, readInput),
+
+        patch: (args) => {
+            const generation = state.generation;
+            const roots = takeDirtyRoots(args.max_dirty_roots);
+            if (roots === null) return null;
+
+            const changed = overlapping(roots);
+            const invalidated = [];
+            for (const [id, el] of state.registry) {
+                if (!isAttached(el) || changed(el)) {
+                    invalidated.push(id);
+                    state.registry.delete(id);
+                }
+            }
+
+            // One traversal for re-extraction and ordering. Kept elements get their
+            // positions re-read: a change elsewhere (inserted banner, dismissed
+            // cookie bar) may have moved them.
+            const trees = scopes();
+            const buttons = collect(args.button_selectors, changed, readButton, trees);
+            const inputs = collect(args.input_selectors, changed, readInput, trees);
+            const positions = [];
+
+            return {
+                document_id: state.documentId,
+                generation: generation,
+                invalidated: invalidated,
+                buttons: buttons.records,
+                inputs: inputs.records,
+                duplicates: buttons.duplicates + inputs.duplicates,
+                button_order: order(args.button_selectors, trees, positions),
+                input_order: order(args.input_selectors, trees, positions),
+                positions: positions
+            };
+        },
+
+        // Visible links as [{text, url, parent_text}] with absolute URLs. Links to
+        // javascript:/mailto: targets and pure in-page fragments are skipped and
+        // every URL is reported once, at its first visible occurrence.
+        extractLinks: () => {
+            const records = [];
+            const seen = new Set();
+
+            scopes().forEach((tree) => tree.root.querySelectorAll('a[href]').forEach((el) => {
+                const rawHref = el.getAttribute('href').trim();
+                if (!rawHref || rawHref.startsWith('#')) return;
+
+                const protocol = rawHref.toLowerCase().replace(/\\s/g, '');
+                if (protocol.startsWith('javascript:') || protocol.startsWith('mailto:')) return;
+
+                let url;
+                try {
+                    url = new URL(rawHref, el.baseURI).href;
+                } catch (e) {
+                    url = rawHref;
+                }
+                if (seen.has(url)) return;
+
+                if (!isVisible(el, el.getBoundingClientRect())) return;
+
+                let text = normalizedText(el, TEXT_LIMIT);
+                if (!text) text = (el.getAttribute('aria-label') || '').trim().slice(0, TEXT_LIMIT);
+
+                seen.add(url);
+                records.push({text: text, url: url, parent_text: parentText(el)});
+            }));
+
+            return records;
+        },
+
+        // Scroll the top window one viewport down and wait for the page to react.
+        // Resolves with {scrolled, changed, grown, generation}: whether the window
+        // moved, whether the DOM changed after `generation`, and whether elements
+        // were added after the scroll and then stayed quiet for `quiet_ms`; gives
+        // up after `timeout_ms` without growth.
+        scrollForMore: (args) => new Promise((resolve) => {
+            const before = window.scrollY;
+            window.scrollBy(0, window.innerHeight);
+            const scrolled = window.scrollY > before;
+
+            // Only added elements count as growth: sticky headers and other
+            // scroll-driven attribute changes do not keep the wait going
+            const started = performance.now();
+            const growthBefore = state.growth;
+            let seen = state.growth;
+            let lastGrowth = started;
+            const poll = () => {
+                const now = performance.now();
+                if (state.growth !== seen) {
+                    seen = state.growth;
+                    lastGrowth = now;
+                }
+                const grown = seen !== growthBefore;
+                if ((grown && now - lastGrowth >= args.quiet_ms) || now - started >= args.timeout_ms) {
+                    const changed = state.generation !== args.generation;
+                    resolve({scrolled: scrolled, changed: changed, grown: grown, generation: state.generation});
+                } else {
+                    setTimeout(poll, 50);
+                }
+            };
+            poll();
+        }),
+
+        // Resolves with {quiet, waited_ms} once the DOM has not changed for
+        // `quiet_ms`, or with quiet = false after `timeout_ms`.
+        waitForQuiet: (args) => new Promise((resolve) => {
+            const started = performance.now();
+            const poll = () => {
+                const now = performance.now();
+                const quiet = now - state.lastChange >= args.quiet_ms;
+                if (quiet || now - started >= args.timeout_ms) {
+                    resolve({quiet: quiet, waited_ms: now - started});
+                } else {
+                    setTimeout(poll, Math.min(50, args.quiet_ms - (now - state.lastChange)));
+                }
+            };
+            poll();
+        }),
+
+        // Make an ID resolve to exactly one element before acting on it: copies
+        // of the stamped node made by the page (loop carousels clone slides)
+        // get fresh IDs, and if the registered element is gone the first copy
+        // takes its place. Returns whether an element holds the ID.
+        claim: (id) => {
+            let owner = state.registry.get(id);
+            if (owner && !isAttached(owner)) owner = null;
+            scopes().forEach((tree) => {
+                tree.root.querySelectorAll(`[${ID_ATTRIBUTE}="${id}"]`).forEach((el) => {
+                    if (!owner) {
+                        owner = el;
+                        state.registry.set(id, el);
+                    } else if (el !== owner) {
+                        assignId(el);
+                    }
+                });
+            });
+            return Boolean(owner);
+        },
+
+        // Stamp IDs on elements found by other extraction paths; targets are
+        // [selector, index] pairs, result holds an ID or null per target.
+        stamp: (targets) => targets.map(([selector, index]) => {
+            const el = document.querySelectorAll(selector)[index];
+            return el ? assignId(el) : null;
+        })
+    };
+
+    Object.defineProperty(window, '__chromeAgent', {value: runtime, enumerable: false});
+    return runtime;
+}
+""".replace(
+    '__ELEMENT_ID_ATTRIBUTE__', ELEMENT_ID_ATTRIBUTE
+).replace(
+    '__ELEMENT_TEXT_LIMIT__', str(ELEMENT_TEXT_LIMIT)
+).replace(
+    '__PARENT_TEXT_LIMIT__', str(PARENT_TEXT_LIMIT)
+)
+
+# Registered with BrowserContext.add_init_script so the observer sees every change
+INSTALL_RUNTIME_SCRIPT = f"({AGENT_RUNTIME_SCRIPT.strip()})();"
+
+
+def _runtime_call(method: str) -> str:
+    """Build script calling runtime method, installing runtime first if needed"""
+    return f"(args) => ({AGENT_RUNTIME_SCRIPT.strip()})().{method}(args)"
+
+
+# Returns {document_id, generation}; with `true` argument also clears dirty
+# regions and element registry before a full parse.
+DOM_STATE_SCRIPT = _runtime_call('takeState')
+
+# Return {records, duplicates}: visible elements matching the given selectors
+# in the document, open shadow roots and same-origin frames, each node once and
+# with a stable ID and frame path, and the count of dropped repeat matches.
+EXTRACT_BUTTONS_SCRIPT = _runtime_call('extractButtons')
+EXTRACT_INPUTS_SCRIPT = _runtime_call('extractInputs')
+
+# Returns visible links as [{text, url, parent_text}] with absolute URLs,
+# including links in open shadow roots and same-origin frames.
+EXTRACT_LINKS_SCRIPT = _runtime_call('extractLinks')
+
+# Re-extracts buttons and inputs only inside subtrees changed since the last
+# parse. Returns null when the change is too broad, otherwise
+# {document_id, generation, invalidated, buttons, inputs, duplicates,
+#  button_order, input_order, positions}; positions are current [id, x, y]
+# of all registered elements, so kept elements follow layout shifts.
+PATCH_ELEMENTS_SCRIPT = _runtime_call('patch')
+
+# Scrolls one viewport down and waits for DOM growth; returns
+# {scrolled, changed, grown, generation}.
+SCROLL_FOR_MORE_SCRIPT = _runtime_call('scrollForMore')
+
+# Waits until the DOM has been quiet for a window; returns {quiet, waited_ms}.
+WAIT_FOR_QUIET_DOM_SCRIPT = _runtime_call('waitForQuiet')
+
+# Stamps IDs on elements given as [[selector, index], ...] and returns them.
+STAMP_ELEMENTS_SCRIPT = _runtime_call('stamp')
+
+# Renumbers page-made copies of a stamped element so its ID selector matches
+# one element; returns whether the ID still resolves.
+CLAIM_ELEMENT_SCRIPT = _runtime_call('claim')
+
+
+def element_selector(element_id: int) -> str:
+    """Attribute selector resolving stamped element ID"""
+    return f'[{ELEMENT_ID_ATTRIBUTE}="{element_id}"]'
+
+
+# Readability-style main content detection. Text paragraphs score their parent
+# (full), grandparent (half) and great-grandparent (third) by length and comma
+# count; candidates are weighted by tag and class/id hints and penalized by link
+# density. Returns {main, rest}: innerText of the best candidate and the rest
+# of body.innerText, or main = '' and the whole text when no candidate fits.
+EXTRACT_MAIN_CONTENT_SCRIPT = """
+() => {
+    const POSITIVE = /article|content|entry|main|post|story|text|body-?text|blog/i;
+    const NEGATIVE = /ad-|banner|breadcrumb|comment|cookie|consent|footer|header|menu|modal|nav|popup|promo|related|share|sidebar|social|sponsor|subscribe|widget/i;
+    const TAG_WEIGHTS = {ARTICLE: 10, MAIN: 10, SECTION: 3, DIV: 5, PRE: 3, TD: 3, BLOCKQUOTE: 3,
+                         FORM: -3, UL: -3, OL: -3, DL: -3, ASIDE: -10, NAV: -10, HEADER: -10, FOOTER: -10};
+    const MIN_PARAGRAPH_LENGTH = 25;
+    const MIN_MAIN_LENGTH = 250;
+    const ANCESTOR_DIVIDERS = [1, 2, 3];
+
+    const body = document.body;
+    if (!body) return {main: '', rest: ''};
+    const full = body.innerText || body.textContent || '';
+
+    const hintWeight = (el) => {
+        const hints = (typeof el.className === 'string' ? el.className : '') + ' ' + (el.id || '');
+        let weight = 0;
+        if (NEGATIVE.test(hints)) weight -= 25;
+        if (POSITIVE.test(hints)) weight += 25;
+        if (el.getAttribute('role') === 'main') weight += 25;
+        return weight;
+    };
+
+    const scores = new Map();
+    const addScore = (el, score) => {
+        if (!el || el === document.documentElement) return;
+        if (!scores.has(el)) scores.set(el, (TAG_WEIGHTS[el.tagName] || 0) + hintWeight(el));
+        scores.set(el, scores.get(el) + score);
+    };
+
+    body.querySelectorAll('p, pre, td, blockquote, li, dd').forEach((paragraph) => {
+        const text = (paragraph.textContent || '').replace(/\\s+/g, ' ').trim();
+        if (text.length < MIN_PARAGRAPH_LENGTH) return;
+
+        const score = 1 + (text.match(/[,，]/g) || []).length + Math.min(Math.floor(text.length / 100), 3);
+        let ancestor = paragraph.parentElement;
+        for (let level = 0; ancestor && level < ANCESTOR_DIVIDERS.length; level++) {
+            addScore(ancestor, score / ANCESTOR_DIVIDERS[level]);
+            ancestor = ancestor.parentElement;
+        }
+    });
+
+    const linkDensity = (el) => {
+        const length = (el.textContent || '').length;
+        if (!length) return 1;
+        let linkLength = 0;
+        el.querySelectorAll('a').forEach((a) => { linkLength += (a.textContent || '').length; });
+        return linkLength / length;
+    };
+
+    let best = null;
+    let bestScore = 0;
+    scores.forEach((score, el) => {
+        const finalScore = score * (1 - linkDensity(el));
+        if (finalScore > bestScore) {
+            best = el;
+            bestScore = finalScore;
+        }
+    });
+    if (!best || best === body) return {main: '', rest: full};
+
+    const main = (best.innerText || '').trim();
+    if (main.length < MIN_MAIN_LENGTH) return {main: '', rest: full};
+
+    // Main text is cut out of the page text; if it cannot be found there, keep page order
+    const start = full.indexOf(main);
+    if (start < 0) return {main: '', rest: full};
+    return {main: main, rest: full.slice(0, start) + '\\n' + full.slice(start + main.length)};
+}
+"""
@@ -0,0 +1,38 @@
+"""
+Limits of scroll-driven extraction on one document.
+Lazily loaded and infinite-scroll pages can grow without end, so scrolling for
+more content stops after a number of viewport scrolls or new elements, or
+after the first scroll that adds no buttons, inputs or links.
+"""
+
+from typing import Optional
+
+
+class ScrollBudget:
+    """Scroll steps and new elements spent on the current document"""
+
+    def __init__(self, max_steps: int, max_new_elements: int):
+        self.max_steps = max_steps
+        self.max_new_elements = max_new_elements
+        self.document_id: Optional[str] = None
+        self.steps = 0
+        self.new_elements = 0
+        self.exhausted = False  # A scroll added no buttons, inputs or links
+
+    def for_document(self, document_id: str) -> "ScrollBudget":
+        """Start counting anew when the page switched to another document"""
+        if document_id != self.document_id:
+            self.document_id = document_id
+            self.steps = 0
+            self.new_elements = 0
+            self.exhausted = False
+        return self
+
+    @property
+    def allows_scroll(self) -> bool:
+        """Whether another scroll step may be made on the current document"""
+        return (
+            not self.exhausted
+            and self.steps < self.max_steps
+            and self.new_elements < self.max_new_elements
+        )
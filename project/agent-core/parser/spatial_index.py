@@ -0,0 +1,52 @@
+"""
+Y-sorted index of page elements for sectioning by vertical position.
+Elements are sorted once; a Y range is then two bisections and a slice, so
+serving a section does not rescan the page.
+"""
+
+import math
+from bisect import bisect_left
+from typing import Generic, List, Sequence, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar('T', bound=BaseModel)
+
+
+class YRangeIndex(Generic[T]):
+    """Elements with `position` (x, y), sorted by Y"""
+
+    def __init__(self, elements: Sequence[T]):
+        self.elements: List[T] = sorted(elements, key=lambda element: element.position[1])
+        self._keys: List[float] = [element.position[1] for element in self.elements]
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def between(self, y_start: float, y_end: float) -> List[T]:
+        """Elements with y_start <= Y < y_end, top to bottom"""
+        return self.elements[bisect_left(self._keys, y_start):bisect_left(self._keys, y_end)]
+
+    def sections(self, section_height: float) -> List[int]:
+        """Sorted numbers of `section_height` bands containing at least one element"""
+        sections: List[int] = []
+        for y in self._keys:
+            section = section_of(y, section_height)
+            if not sections or sections[-1] != section:
+                sections.append(section)
+        return sections
+
+
+def merge_sections(*section_lists: List[int]) -> List[int]:
+    """Union of sorted section number lists"""
+    return sorted(set().union(*section_lists))
+
+
+def section_of(y: float, section_height: float) -> int:
+    """Number of the `section_height` band containing Y"""
+    return math.floor(y / section_height)
+
+
+def section_bounds(section: int, section_height: float) -> Tuple[float, float]:
+    """Y range [start, end) covered by section number"""
+    return section * section_height, (section + 1) * section_height
@@ -0,0 +1,90 @@
+"""
+Token-budgeted splitting of page text into chunks for get_page_text_next_item.
+Chunks are packed from whole paragraphs; a paragraph over the budget is split
+by sentences, and a sentence over the budget by words.
+"""
+
+import math
+import re
+from typing import Callable, Iterator, List, Tuple
+
+# Estimates how many LLM tokens a string costs
+TokenCounter = Callable[[str], int]
+
+_WORD_PATTERN = re.compile(r'\w+|[^\w\s]')
+_PARAGRAPH_PATTERN = re.compile(r'[^\n]+\n*|\n+')
+_SENTENCE_PATTERN = re.compile(r'.*?[.!?…]+(?:\s+|$)|.+', re.S)
+_TOKEN_PIECE_PATTERN = re.compile(r'\S+\s*|\s+')
+
+# Average characters per token for BPE vocabularies of current LLMs
+_ASCII_CHARS_PER_TOKEN = 4
+_NON_ASCII_CHARS_PER_TOKEN = 2  # Cyrillic and other scripts split into shorter pieces
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate token count without a tokenizer: words by script, punctuation as one token each"""
+    tokens = 0
+    for word in _WORD_PATTERN.findall(text):
+        chars_per_token = _ASCII_CHARS_PER_TOKEN if word.isascii() else _NON_ASCII_CHARS_PER_TOKEN
+        tokens += math.ceil(len(word) / chars_per_token)
+    return tokens
+
+
+class TextChunker:
+    """Splits text into chunks of at most `max_tokens` estimated tokens on natural boundaries"""
+
+    def __init__(self, max_tokens: int, count_tokens: TokenCounter = estimate_tokens):
+        self.max_tokens = max_tokens
+        self.count_tokens = count_tokens
+
+    def split(self, text: str) -> List[str]:
+        """Split text into chunks
+
+        Args:
+            text: Full page text
+
+        Returns:
+            Non-empty stripped chunks in text order
+        """
+        chunks: List[str] = []
+        current: List[str] = []
+        current_tokens = 0
+
+        for piece, tokens in self._pieces(text):
+            if current and current_tokens + tokens > self.max_tokens:
+                chunks.append(''.join(current))
+                current = []
+                current_tokens = 0
+            current.append(piece)
+            current_tokens += tokens
+
+        if current:
+            chunks.append(''.join(current))
+
+        return [chunk.strip() for chunk in chunks if chunk.strip()]
+
+    def _pieces(self, text: str) -> Iterator[Tuple[str, int]]:
+        """Yield (piece, tokens) units that fit the budget, coarsest boundary first"""
+        for paragraph in _PARAGRAPH_PATTERN.findall(text):
+            tokens = self.count_tokens(paragraph)
+            if tokens <= self.max_tokens:
+                yield paragraph, tokens
+                continue
+            for sentence in _SENTENCE_PATTERN.findall(paragraph):
+                tokens = self.count_tokens(sentence)
+                if tokens <= self.max_tokens:
+                    yield sentence, tokens
+                    continue
+                for word in _TOKEN_PIECE_PATTERN.findall(sentence):
+                    yield from self._split_word(word)
+
+    def _split_word(self, word: str) -> Iterator[Tuple[str, int]]:
+        """Cut a single piece longer than the budget into budget-sized slices"""
+        tokens = self.count_tokens(word)
+        if tokens <= self.max_tokens:
+            yield word, tokens
+            return
+        size = max(1, len(word) * self.max_tokens // tokens)
+        for i in range(0, len(word), size):
+            part = word[i:i + size]
+            yield part, self.count_tokens(part)
@@ -0,0 +1,4 @@
+"""
+Tests for Chrome Agent.
+Run from project root: python -m pytest tests
+"""
@@ -0,0 +1,74 @@
+from models.page import PageTextItem
+from parser.boilerplate import BoilerplateRegistry
+from parser.page_snapshot import PageSnapshot
+
+HEADER = "Acme Store\nCatalog Delivery Returns Contacts\nCall us: +1 555 0100"
+
+
+def page_text(body: str) -> str:
+    return f"{HEADER}\n{body}"
+
+
+def make_snapshot(url: str, text: str, collapsed: list) -> PageSnapshot:
+    return PageSnapshot(
+        version=1,
+        url=url,
+        document_id='doc',
+        generation=0,
+        title='Acme',
+        text_items=[PageTextItem(item_id=0, total_items=1, url=url, title='Acme', text_chunk=text)],
+        links_items=[],
+        links=[],
+        buttons_internal=[],
+        buttons=[],
+        inputs_internal=[],
+        inputs=[],
+        section_height=800,
+        collapsed_text_chunks=collapsed
+    )
+
+
+def test_header_is_collapsed_on_second_page_of_domain():
+    registry = BoilerplateRegistry(max_fingerprints_per_domain=1000, min_collapsed_chars=20)
+
+    first, first_collapsed = registry.collapse_text('https://acme.test/a', page_text("Red shoes, size 42"))
+    assert first == page_text("Red shoes, size 42")
+    assert first_collapsed == []
+
+    second, second_collapsed = registry.collapse_text('https://acme.test/b', page_text("Blue hat, one size"))
+    assert "Call us" not in second
+    assert "repeated from other pages of acme.test omitted" in second
+    assert second.endswith("Blue hat, one size")
+    assert second_collapsed == [HEADER]
+
+
+def test_other_domain_is_not_collapsed():
+    registry = BoilerplateRegistry(max_fingerprints_per_domain=1000, min_collapsed_chars=20)
+    registry.collapse_text('https://acme.test/a', page_text("Red shoes"))
+    text, collapsed = registry.collapse_text('https://other.test/a', page_text("Red shoes"))
+    assert text == page_text("Red shoes")
+    assert collapsed == []
+
+
+def test_short_runs_are_kept():
+    registry = BoilerplateRegistry(max_fingerprints_per_domain=1000, min_collapsed_chars=500)
+    registry.collapse_text('https://acme.test/a', page_text("Red shoes"))
+    text, collapsed = registry.collapse_text('https://acme.test/b', page_text("Blue hat"))
+    assert text == page_text("Blue hat")
+    assert collapsed == []
+
+
+def test_search_finds_collapsed_text():
+    registry = BoilerplateRegistry(max_fingerprints_per_domain=1000, min_collapsed_chars=20)
+    registry.collapse_text('https://acme.test/a', page_text("Red shoes"))
+    text, collapsed = registry.collapse_text('https://acme.test/b', page_text("Blue hat"))
+
+    snapshot = make_snapshot('https://acme.test/b', text, collapsed)
+    hits = snapshot.search("call us phone", top_k=3).hits
+    assert hits
+    assert hits[0].kind == 'text'
+    assert hits[0].item_id is None
+    assert "+1 555 0100" in hits[0].text
+
+    body_hits = snapshot.search("blue hat", top_k=3).hits
+    assert body_hits[0].item_id == 0
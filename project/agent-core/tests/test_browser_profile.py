@@ -0,0 +1,45 @@
+import os
+import socket
+import time
+
+from parser.browser_profile import BrowserProfileStore
+
+
+def make_profile(root, name, size=0, age_days=0):
+    path = root / name
+    (path / 'Default' / 'Cache').mkdir(parents=True)
+    (path / 'Default' / 'Cache' / 'data').write_bytes(b'x' * size)
+    marker = path / '.last_used'
+    marker.touch()
+    stamp = time.time() - age_days * 24 * 60 * 60
+    os.utime(marker, (stamp, stamp))
+    return path
+
+
+def lock(path, pid):
+    os.symlink(f"{socket.gethostname()}-{pid}", path / 'SingletonLock')
+
+
+def test_profile_held_by_running_chromium_is_kept(tmp_path):
+    store = BrowserProfileStore(str(tmp_path), max_size_mb=1, max_age_days=1)
+    held = make_profile(tmp_path, 'held', age_days=5)
+    lock(held, os.getpid())
+    assert store.cleanup(active='default') == []
+    assert held.is_dir()
+
+
+def test_lock_left_by_crashed_chromium_is_ignored(tmp_path):
+    store = BrowserProfileStore(str(tmp_path), max_size_mb=1, max_age_days=1)
+    stale = make_profile(tmp_path, 'stale', age_days=5)
+    lock(stale, 2 ** 22 + 1)  # Above the Linux PID limit, never running
+    assert store.cleanup(active='default') == ['stale: unused, removed']
+    assert not stale.exists()
+
+
+def test_size_cap_is_enforced_on_active_profile_only(tmp_path):
+    store = BrowserProfileStore(str(tmp_path), max_size_mb=1, max_age_days=1)
+    other = make_profile(tmp_path, 'other', size=2 * 1024 * 1024)
+    active = make_profile(tmp_path, 'active', size=2 * 1024 * 1024)
+    assert store.cleanup(active='active') == ['active: over size cap, caches cleared']
+    assert (other / 'Default' / 'Cache').is_dir()
+    assert not (active / 'Default' / 'Cache').exists()
@@ -0,0 +1,38 @@
+from parser.dom_snapshot import DomSnapshotDocument
+
+
+def make_response(scroll_x: float, scroll_y: float) -> dict:
+    """captureSnapshot response: html > body > button with layout bounds in document space"""
+    strings = ['https://example.com/', 'HTML', 'BODY', 'BUTTON', 'block', 'visible', 'inline-block']
+    return {
+        'strings': strings,
+        'documents': [{
+            'documentURL': 0,
+            'scrollOffsetX': scroll_x,
+            'scrollOffsetY': scroll_y,
+            'nodes': {
+                'parentIndex': [-1, 0, 1],
+                'nodeType': [1, 1, 1],
+                'nodeName': [1, 2, 3],
+                'nodeValue': [-1, -1, -1],
+                'attributes': [[], [], []],
+                'backendNodeId': [1, 2, 3],
+            },
+            'layout': {
+                'nodeIndex': [0, 1, 2],
+                'bounds': [[0, 0, 1280, 3000], [0, 0, 1280, 3000], [100, 2000, 80, 20]],
+                'styles': [[4, 5], [4, 5], [6, 5]],
+                'text': [-1, -1, -1],
+            },
+        }],
+    }
+
+
+def test_box_center_is_in_document_coordinates():
+    document = DomSnapshotDocument(make_response(0, 0))
+    assert document.box_center(2) == (140, 2010)
+
+
+def test_box_center_does_not_depend_on_scroll():
+    document = DomSnapshotDocument(make_response(50, 1800))
+    assert document.box_center(2) == (140, 2010)
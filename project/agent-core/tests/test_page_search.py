@@ -0,0 +1,47 @@
+from parser.page_search import PageSearchIndex, SearchDocument, tokenize
+
+
+def make_index() -> PageSearchIndex:
+    return PageSearchIndex([
+        SearchDocument('text', 'Shipping and delivery terms for all orders', item_id=0),
+        SearchDocument('text', 'Delivery delivery delivery: free delivery over 50 EUR', item_id=1),
+        SearchDocument('button', 'Add to cart', element_id=7),
+        SearchDocument('link', 'Доставка и оплата', url='https://shop.example/delivery-ru'),
+    ])
+
+
+def test_tokenize_lowercases_and_keeps_any_script():
+    assert tokenize('Add-to-Cart, Доставка!') == ['add', 'to', 'cart', 'доставка']
+
+
+def test_more_frequent_term_ranks_first():
+    results = make_index().search('delivery', top_k=5)
+    assert [document.item_id for document, _ in results[:2]] == [1, 0]
+    assert results[0][1] > results[1][1] > 0
+
+
+def test_rare_term_outweighs_common_one():
+    results = make_index().search('cart delivery', top_k=5)
+    assert results[0][0].element_id == 7
+
+
+def test_url_and_non_latin_text_are_searchable():
+    results = make_index().search('доставка', top_k=5)
+    assert [document.kind for document, _ in results] == ['link']
+
+
+def test_empty_or_unknown_query_returns_nothing():
+    index = make_index()
+    assert index.search('', top_k=5) == []
+    assert index.search('   ', top_k=5) == []
+    assert index.search('nonexistent', top_k=5) == []
+
+
+def test_top_k_limits_results():
+    index = make_index()
+    assert len(index.search('delivery', top_k=1)) == 1
+    assert index.search('delivery', top_k=0) == []
+
+
+def test_empty_index():
+    assert PageSearchIndex([]).search('delivery', top_k=3) == []
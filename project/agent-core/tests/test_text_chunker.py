@@ -0,0 +1,55 @@
+from parser.text_chunker import TextChunker, estimate_tokens
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def test_paragraphs_are_packed_up_to_the_budget():
+    chunker = TextChunker(6, count_words)
+    text = "one two three\n\nfour five six\n\nseven eight"
+    assert chunker.split(text) == ["one two three\n\nfour five six", "seven eight"]
+
+
+def test_no_chunk_exceeds_the_budget():
+    chunker = TextChunker(5, count_words)
+    text = "\n".join(f"Sentence number {i} is here. Another one follows." for i in range(20))
+    chunks = chunker.split(text)
+    assert chunks
+    assert all(count_words(chunk) <= 5 for chunk in chunks)
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_oversized_paragraph_is_split_by_sentences():
+    chunker = TextChunker(4, count_words)
+    text = "First short one. Second short one. Third short one."
+    assert chunker.split(text) == ["First short one.", "Second short one.", "Third short one."]
+
+
+def test_oversized_sentence_is_split_by_words():
+    chunker = TextChunker(3, count_words)
+    text = "a b c d e f g"
+    assert chunker.split(text) == ["a b c", "d e f", "g"]
+
+
+def test_oversized_word_is_sliced():
+    chunker = TextChunker(2)
+    word = "x" * 40  # 10 estimated tokens
+    chunks = chunker.split(word)
+    assert "".join(chunks) == word
+    assert all(estimate_tokens(chunk) <= 2 for chunk in chunks)
+
+
+def test_custom_counter_is_used():
+    calls = []
+
+    def counter(text: str) -> int:
+        calls.append(text)
+        return len(text)
+
+    assert TextChunker(100, counter).split("hello") == ["hello"]
+    assert calls
+
+
+def test_empty_text_gives_no_chunks():
+    assert TextChunker(10).split("  \n\n ") == []
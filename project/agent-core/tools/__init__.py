@@ -5,6 +5,7 @@ from .press_key import press_key
 from .get_page_text_next_item import get_page_text_next_item
 from .get_page_buttons_next_item import get_page_buttons_next_item
 from .get_page_links_next_item import get_page_links_next_item
+from .search_page import search_page
 
 __all__ = [
     "click_button",
@@ -15,5 +16,6 @@ __all__ = [
     "press_key",
     "get_page_text_next_item",
     "get_page_buttons_next_item",
-    "get_page_links_next_item"
+    "get_page_links_next_item",
+    "search_page"
 ]
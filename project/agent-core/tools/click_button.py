@@ -1,6 +1,7 @@
 from typing import Dict, Any, TYPE_CHECKING
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
+from config import config
 from agent.debug_tools import log_error
 from exceptions.tool_execution import ElementNotFoundError
 from exceptions.unknown_error import UnknownError
@@ -29,8 +30,9 @@ async def click_button(browser_manager: "BrowserManager", button_id: int) -> Dic
         if not button_internal:
             raise ElementNotFoundError(f"button_id={button_id}", timeout=0)
         
+        # Renumber page-made copies of the element so its locator stays unique
+        await browser_manager.claim_element(button_id)
         element = button_internal.element
-        page = browser_manager.page
         
         # Wait for element to be visible and clickable
         await element.wait_for(state='visible', timeout=5000)
@@ -41,15 +43,13 @@ async def click_button(browser_manager: "BrowserManager", button_id: int) -> Dic
         # Click the element
         await element.click(timeout=5000)
         
-        # Wait for potential navigation or loading
-        try:
-            await page.wait_for_load_state('networkidle', timeout=3000)
-        except PlaywrightTimeout:
-            pass  # Page might not navigate, that's okay
+        # Wait for potential navigation or loading to settle
+        waited = await browser_manager.wait_until_ready(config.readiness_action_timeout)
         
         return {
             "success": True,
-            "message": f"Successfully clicked button (ID: {button_id}, text: '{button_internal.text}')"
+            "message": f"Successfully clicked button (ID: {button_id}, text: '{button_internal.text}'), page ready after {waited} ms",
+            "waited_ms": waited
         }
         
     except PlaywrightTimeout:
@@ -32,7 +32,7 @@ async def get_page_buttons_next_item(browser_manager: "BrowserManager") -> Dict[
         
         return {
             "success": True,
-            "buttons_item": item.model_dump(),
+            "buttons_item": item.model_dump(exclude_none=True),
             "message": f"Retrieved buttons {item.item_id + 1}/{item.total_items}"
         }
         
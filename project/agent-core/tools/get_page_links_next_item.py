@@ -32,7 +32,7 @@ async def get_page_links_next_item(browser_manager: "BrowserManager") -> Dict[st
         
         return {
             "success": True,
-            "links_item": item.model_dump(),
+            "links_item": item.model_dump(exclude_none=True),
             "message": f"Retrieved links {item.item_id + 1}/{item.total_items}"
         }
         
@@ -1,9 +1,11 @@
 from typing import Dict, Any
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
 
+from config import config
 from agent.debug_tools import log_error
 from exceptions.tool_execution import NavigationTimeoutError
 from exceptions.unknown_error import UnknownError
+from parser.readiness import PageReadiness
 from .utils import handle_browser_closed
 
 
@@ -24,19 +26,22 @@ async def navigate(page: Page, url: str) -> Dict[str, Any]:
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url
         
-        # Navigate to URL
-        await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-        
-        # Wait for page to be ready
+        # Track requests from the start of the navigation
+        readiness = PageReadiness(page)
         try:
-            await page.wait_for_load_state('networkidle', timeout=10000)
-        except PlaywrightTimeout:
-            pass  # Page might still be loading resources, that's okay
+            # Navigate to URL
+            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            
+            # Wait for page to be ready
+            waited = await readiness.wait(config.readiness_navigation_timeout)
+        finally:
+            readiness.detach()
         
         return {
             "success": True,
-            "message": f"Successfully navigated to: {url}",
-            "current_url": page.url
+            "message": f"Successfully navigated to: {url}, page ready after {waited} ms",
+            "current_url": page.url,
+            "waited_ms": waited
         }
         
     except PlaywrightTimeout:
@@ -61,12 +66,18 @@ async def go_back(page: Page) -> Dict[str, Any]:
         Dict with success status and message
     """
     try:
-        await page.go_back(wait_until='domcontentloaded', timeout=10000)
+        readiness = PageReadiness(page)
+        try:
+            await page.go_back(wait_until='domcontentloaded', timeout=10000)
+            waited = await readiness.wait(config.readiness_navigation_timeout)
+        finally:
+            readiness.detach()
         
         return {
             "success": True,
-            "message": "Successfully navigated back",
-            "current_url": page.url
+            "message": f"Successfully navigated back, page ready after {waited} ms",
+            "current_url": page.url,
+            "waited_ms": waited
         }
         
     except Exception as e:
@@ -1,6 +1,6 @@
 from typing import Dict, Any, TYPE_CHECKING
-from playwright.async_api import TimeoutError as PlaywrightTimeout
 
+from config import config
 from agent.debug_tools import log_error
 from exceptions.unknown_error import UnknownError
 from .utils import handle_browser_closed
@@ -54,15 +54,13 @@ async def press_key(browser_manager: "BrowserManager", key: str) -> Dict[str, An
         # Press the key
         await page.keyboard.press(normalized_key)
         
-        # Wait a bit for potential page changes
-        try:
-            await page.wait_for_load_state('networkidle', timeout=2000)
-        except PlaywrightTimeout:
-            pass  # Page might not change, that's okay
+        # Wait for potential page changes to settle
+        waited = await browser_manager.wait_until_ready(config.readiness_action_timeout)
         
         return {
             "success": True,
-            "message": f"Successfully pressed key: {normalized_key}"
+            "message": f"Successfully pressed key: {normalized_key}, page ready after {waited} ms",
+            "waited_ms": waited
         }
         
     except Exception as e:
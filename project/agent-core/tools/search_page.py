@@ -0,0 +1,44 @@
+from typing import Dict, Any, TYPE_CHECKING
+
+from exceptions.browser_closed import BrowserClosedError
+from .utils import handle_browser_closed
+from agent.debug_tools import log_error
+from exceptions.unknown_error import UnknownError
+
+if TYPE_CHECKING:
+    from parser.browser_manager import BrowserManager
+
+
+@handle_browser_closed
+async def search_page(browser_manager: "BrowserManager", query: str) -> Dict[str, Any]:
+    """
+    Search current page for text chunks, buttons, inputs and links matching query.
+    
+    Args:
+        browser_manager: BrowserManager instance
+        query: Words to search for
+        
+    Returns:
+        Dict with ranked matches or message when nothing matched
+    """
+    try:
+        item = await browser_manager.search_page(query)
+        
+        if not item.hits:
+            return {
+                "success": False,
+                "message": f"Nothing found on the page for '{query}'."
+            }
+        
+        return {
+            "success": True,
+            "search_item": item.model_dump(exclude_none=True),
+            "message": f"Found {len(item.hits)} matches for '{query}'"
+        }
+        
+    except BrowserClosedError:
+        raise
+    except Exception as e:
+        err = UnknownError(e)
+        log_error(err)
+        raise err from e
@@ -1,6 +1,7 @@
 from typing import Dict, Any, TYPE_CHECKING
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 
+from config import config
 from agent.debug_tools import log_error
 from exceptions.tool_execution import ElementNotFoundError
 from exceptions.unknown_error import UnknownError
@@ -30,6 +31,8 @@ async def type_text(browser_manager: "BrowserManager", input_id: int, text: str)
         if not input_internal:
             raise ElementNotFoundError(f"input_id={input_id}", timeout=0)
         
+        # Renumber page-made copies of the element so its locator stays unique
+        await browser_manager.claim_element(input_id)
         element = input_internal.element
         
         # Wait for element to be visible
@@ -44,9 +47,13 @@ async def type_text(browser_manager: "BrowserManager", input_id: int, text: str)
         # Type text
         await element.type(text, delay=50)
         
+        # Wait for suggestions or validation triggered by typing to settle
+        waited = await browser_manager.wait_until_ready(config.readiness_action_timeout)
+        
         return {
             "success": True,
-            "message": f"Successfully typed text into input (ID: {input_id})"
+            "message": f"Successfully typed text into input (ID: {input_id}), page ready after {waited} ms",
+            "waited_ms": waited
         }
         
     except PlaywrightTimeout:
@@ -81,6 +88,8 @@ async def fill_input(browser_manager: "BrowserManager", input_id: int, text: str
         if not input_internal:
             raise ElementNotFoundError(f"input_id={input_id}", timeout=0)
         
+        # Renumber page-made copies of the element so its locator stays unique
+        await browser_manager.claim_element(input_id)
         element = input_internal.element
         
         # Wait for element to be visible
@@ -92,9 +101,13 @@ async def fill_input(browser_manager: "BrowserManager", input_id: int, text: str
         # Fill (clears and types)
         await element.fill(text)
         
+        # Wait for suggestions or validation triggered by the input to settle
+        waited = await browser_manager.wait_until_ready(config.readiness_action_timeout)
+        
         return {
             "success": True,
-            "message": f"Successfully filled input (ID: {input_id})"
+            "message": f"Successfully filled input (ID: {input_id}), page ready after {waited} ms",
+            "waited_ms": waited
         }
         
     except PlaywrightTimeout:
@@ -1,19 +1,33 @@
 import asyncio
-from typing import Dict, Any
+from typing import Dict, Any, TYPE_CHECKING
 
 from config import config
+from .utils import handle_browser_closed
 
+if TYPE_CHECKING:
+    from parser.browser_manager import BrowserManager
 
-async def wait() -> Dict[str, Any]:
+
+@handle_browser_closed
+async def wait(browser_manager: "BrowserManager") -> Dict[str, Any]:
     """
     Wait for page to finish loading/verification.
     Used when browser shows verification pages or loading screens.
+    Always waits config.wait_min_delay, since a "checking your browser" page or
+    countdown can look quiet while it is still going; then returns as soon as
+    the page is quiet, at most after config.wait_delay in total.
     
+    Args:
+        browser_manager: BrowserManager instance
+        
     Returns:
         Dict with success status and message
     """
-    await asyncio.sleep(config.wait_delay / 1000)
+    min_delay = min(config.wait_min_delay, config.wait_delay)
+    await asyncio.sleep(min_delay / 1000)
+    waited = min_delay + await browser_manager.wait_until_ready(config.wait_delay - min_delay)
     return {
         "success": True,
-        "message": f"Waited {config.wait_delay}ms"
+        "message": f"Waited {waited}ms",
+        "waited_ms": waited
     }